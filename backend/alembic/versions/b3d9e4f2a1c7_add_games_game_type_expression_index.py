@@ -0,0 +1,34 @@
+"""add games gameType expression index
+
+Revision ID: b3d9e4f2a1c7
+Revises: 8f2c1e6b4d7a
+Create Date: 2026-10-15 00:00:00.000000
+
+Expression index on the NHL gameType stored in the raw schedule JSON, so
+preseason filters (check_game_types.py, delete_preseason.py) written as
+Game.raw['gameType'].as_integer() == 1 can use an index scan instead of
+decoding every row's JSON. Also declared on Game.__table_args__ so
+autogenerate keeps it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b3d9e4f2a1c7'
+down_revision: Union[str, Sequence[str], None] = '8f2c1e6b4d7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_games_game_type',
+        'games',
+        [sa.text("((raw ->> 'gameType')::integer)")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_game_type', table_name='games')
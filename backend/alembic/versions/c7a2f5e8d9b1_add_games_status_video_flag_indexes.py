@@ -0,0 +1,38 @@
+"""add games status + video flag indexes
+
+Revision ID: c7a2f5e8d9b1
+Revises: b3d9e4f2a1c7
+Create Date: 2026-10-15 00:00:01.000000
+
+Composite indexes for the video pipeline's "what still needs fetching"
+predicates (status + highlights_fetched / professor_hockey_fetched), used
+by crud.get_games_needing_highlights / get_games_needing_professor_hockey
+every hour and by the season backfill.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'c7a2f5e8d9b1'
+down_revision: Union[str, Sequence[str], None] = 'b3d9e4f2a1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_games_status_highlights',
+        'games',
+        ['status', 'highlights_fetched'],
+    )
+    op.create_index(
+        'ix_games_status_professor_hockey',
+        'games',
+        ['status', 'professor_hockey_fetched'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_games_status_professor_hockey', table_name='games')
+    op.drop_index('ix_games_status_highlights', table_name='games')
@@ -8,7 +8,6 @@ from datetime import datetime
 
 from app.api.v1.deps import get_db
 from app.crud import game as game_crud
-from app.crud import video as video_crud
 from app.schemas.game import GameSummary, GameDetail, GameCreate, GameUpdate
 from app.services.redis_cache import cache
 
@@ -43,9 +42,10 @@ def get_recent_games(
     # Transform to summary format with video availability
     summaries = []
     for game in games:
-        # Check if videos exist
-        nhl_video = video_crud.get_video_by_type(db, game.game_id, "nhl_official")
-        prof_video = video_crud.get_video_by_type(db, game.game_id, "professor_hockey")
+        # Videos are eager-loaded by get_recent_games; no per-game queries
+        has_videos = any(
+            v.video_type in ("nhl_official", "professor_hockey") for v in game.videos
+        )
 
         summaries.append(GameSummary(
             game_id=game.game_id,
@@ -55,7 +55,7 @@ def get_recent_games(
             away_score=game.away_score,
             home_score=game.home_score,
             status=game.status,
-            has_videos=bool(nhl_video or prof_video)
+            has_videos=has_videos
         ))
 
     # Cache the result as dicts for 5 minutes (300 seconds)
@@ -87,35 +87,7 @@ def get_game(game_id: int, db: Session = Depends(get_db)):
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
-    # Get video IDs
-    nhl_video = video_crud.get_video_by_type(db, game_id, "nhl_official")
-    prof_video = video_crud.get_video_by_type(db, game_id, "professor_hockey")
-
-    game_detail = GameDetail(
-        game_id=game.game_id,
-        game_date_utc=game.game_date_utc,
-        status=game.status,
-        away_team=game.away_team,
-        home_team=game.home_team,
-        away_score=game.away_score,
-        home_score=game.home_score,
-        scorers=game.scorers,
-        recap_text=game.recap_text,
-        summary_line=game.summary_line,
-        nhl_video_id=nhl_video.youtube_id if nhl_video else None,
-        professor_hockey_video_id=prof_video.youtube_id if prof_video else None,
-        videos=[
-            {
-                "id": v.id,
-                "youtube_id": v.youtube_id,
-                "title": v.title,
-                "video_type": v.video_type,
-                "channel_name": v.channel_name,
-                "thumbnail_url": v.thumbnail_url
-            }
-            for v in game.videos
-        ]
-    )
+    game_detail = GameDetail.from_game(game)
 
     # Cache the result as dict for 5 minutes (300 seconds)
     result = game_detail.model_dump()
@@ -11,8 +11,7 @@ import logging
 
 from app.api.v1.deps import get_db
 from app.services.redis_cache import cache
-from app.models.game import Game
-from app.models.video import Video
+from app.crud.game import get_video_progress
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -108,11 +107,8 @@ def get_database_stats(db: Session = Depends(get_db)):
         - Connection info
     """
     try:
-        # Get table row counts
-        game_count = db.query(Game).count()
-        video_count = db.query(Video).count()
-        completed_games = db.query(Game).filter(Game.status.in_(['FINAL', 'OFF'])).count()
-        games_with_videos = db.query(Game).filter(Game.videos_fetched == True).count()
+        # Get table row counts (one query for all counters)
+        progress = get_video_progress(db)
 
         # Get database size
         result = db.execute(text("SELECT pg_database_size(current_database()) as size"))
@@ -123,13 +119,13 @@ def get_database_stats(db: Session = Depends(get_db)):
             "timestamp": datetime.utcnow().isoformat(),
             "tables": {
                 "games": {
-                    "total": game_count,
-                    "completed": completed_games,
-                    "with_videos": games_with_videos,
-                    "pending_videos": completed_games - games_with_videos
+                    "total": progress["total"],
+                    "completed": progress["completed"],
+                    "with_videos": progress["videos_fetched"],
+                    "pending_videos": progress["completed"] - progress["videos_fetched"]
                 },
                 "videos": {
-                    "total": video_count
+                    "total": progress["videos"]
                 }
             },
             "database": {
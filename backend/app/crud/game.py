@@ -2,9 +2,9 @@
 CRUD operations for Game model.
 """
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from sqlalchemy import desc, func
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional
 from app.models.game import Game
 from app.models.video import Video
 from app.services.redis_cache import cache
@@ -120,6 +120,49 @@ def mark_professor_hockey_fetched(db: Session, game_id: int) -> bool:
     return True
 
 
+def _sharks_game_numbers_query(db: Session, team: str):
+    """Subquery of (game_id, game_number) for a team's games in date order."""
+    return db.query(
+        Game.game_id,
+        func.row_number().over(order_by=Game.game_date_utc).label("game_number"),
+    ).filter(
+        (Game.away_team == team) | (Game.home_team == team)
+    ).subquery()
+
+
+def get_sharks_game_numbers(db: Session, team: str = "SJS") -> Dict[int, int]:
+    """Map of game_id -> season game number for every game of `team`.
+
+    Professor Hockey titles videos by game number ("Game 42"), so the video
+    jobs need this to match uploads. One window pass for the whole season.
+    """
+    numbered = _sharks_game_numbers_query(db, team)
+    return dict(db.query(numbered.c.game_id, numbered.c.game_number).all())
+
+
+def get_video_progress(db: Session) -> dict:
+    """Video pipeline progress counters in a single round trip.
+
+    Returns a dict with: total (all games), completed (FINAL/OFF games),
+    highlights_fetched / professor_hockey_fetched / videos_fetched (completed
+    games with that flag, or both flags, set), and videos (total stored
+    videos). Uses FILTER aggregates so the games table is scanned once
+    instead of once per counter.
+    """
+    completed = Game.status.in_(["FINAL", "OFF"])
+    highlights = Game.highlights_fetched.is_(True)
+    professor_hockey = Game.professor_hockey_fetched.is_(True)
+    row = db.query(
+        func.count().label("total"),
+        func.count().filter(completed).label("completed"),
+        func.count().filter(completed & highlights).label("highlights_fetched"),
+        func.count().filter(completed & professor_hockey).label("professor_hockey_fetched"),
+        func.count().filter(completed & highlights & professor_hockey).label("videos_fetched"),
+        db.query(func.count(Video.id)).scalar_subquery().label("videos"),
+    ).select_from(Game).one()
+    return row._asdict()
+
+
 def get_games_needing_reddit(db: Session, status: str = "FINAL") -> list[Game]:
     """Get completed games that need Reddit sentiment analysis."""
     return db.query(Game).filter(
@@ -1,19 +1,24 @@
 """
 CRUD operations for Video model.
 """
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, Dict, List, Set, Tuple
 from datetime import datetime
 from app.models.video import Video
 
+# Built once; executed with plain dicts so inserts skip ORM object
+# construction, identity-map bookkeeping and the post-commit refresh.
+_video_insert = Video.__table__.insert()
 
-def create_video(db: Session, video_data: dict) -> Video:
-    """Create a new video."""
-    video = Video(**video_data)
-    db.add(video)
+
+def create_videos(db: Session, videos_data: List[dict]) -> int:
+    """Insert several videos in one statement. Returns the number inserted."""
+    if not videos_data:
+        return 0
+    db.execute(_video_insert, videos_data)
     db.commit()
-    db.refresh(video)
-    return video
+    return len(videos_data)
 
 
 def get_videos_by_game(db: Session, game_id: int) -> List[Video]:
@@ -29,12 +34,25 @@ def get_video_by_type(db: Session, game_id: int, video_type: str) -> Optional[Vi
     ).first()
 
 
-def video_exists(db: Session, game_id: int, youtube_id: str) -> bool:
-    """Check if a video already exists."""
-    return db.query(Video).filter(
-        Video.game_id == game_id,
-        Video.youtube_id == youtube_id
-    ).first() is not None
+def get_existing_video_keys(db: Session, game_ids: List[int]) -> Set[Tuple[int, str]]:
+    """Get (game_id, youtube_id) pairs already stored for the given games.
+
+    One query for a whole batch, so loops can check membership in memory
+    instead of querying per candidate.
+    """
+    if not game_ids:
+        return set()
+    rows = db.query(Video.game_id, Video.youtube_id).filter(
+        Video.game_id.in_(game_ids)
+    ).all()
+    return {(game_id, youtube_id) for game_id, youtube_id in rows}
+
+
+def get_video_type_counts(db: Session) -> Dict[str, int]:
+    """Number of stored videos per video_type, from one grouped query."""
+    return dict(
+        db.query(Video.video_type, func.count()).group_by(Video.video_type).all()
+    )
 
 
 def delete_video(db: Session, video_id: int) -> bool:
@@ -2,6 +2,8 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
 
-engine = create_engine(settings.DATABASE_URL, echo=True)
+# pool_pre_ping transparently replaces connections the server has dropped
+# (e.g. after a Railway Postgres restart) instead of failing the next query.
+engine = create_engine(settings.DATABASE_URL, echo=True, pool_size=5, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
\ No newline at end of file
@@ -15,7 +15,6 @@ import logging
 
 from app.config import settings
 from app.db.session import SessionLocal
-from app.models.game import Game
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -146,10 +145,13 @@ def check_and_fetch_videos_job():
 
         from app.crud.game import (
             get_games_needing_highlights, get_games_needing_professor_hockey,
-            mark_highlights_fetched, mark_professor_hockey_fetched
+            mark_highlights_fetched, mark_professor_hockey_fetched,
+            get_sharks_game_numbers
         )
-        from app.services.youtube import search_game_highlights, YouTubeQuotaExceeded
-        from app.crud.video import create_video, video_exists
+        from app.services.youtube import (
+            search_game_highlights, prefetch_channel_uploads, YouTubeQuotaExceeded
+        )
+        from app.crud.video import create_videos, get_existing_video_keys
 
         videos_added = 0
         quota_exceeded = False
@@ -158,7 +160,28 @@ def check_and_fetch_videos_job():
         highlight_games = get_games_needing_highlights(db, status="FINAL")
         highlight_games += get_games_needing_highlights(db, status="OFF")
 
+        # Stored (game_id, youtube_id) pairs for every candidate game, fetched
+        # once so the loops below check membership in memory.
+        prof_candidates = (get_games_needing_professor_hockey(db, status="FINAL")
+                           + get_games_needing_professor_hockey(db, status="OFF"))
+        existing_videos = get_existing_video_keys(
+            db, [g.game_id for g in highlight_games + prof_candidates]
+        )
+
+        # Warm the upload lists the pending games need, concurrently
+        needed_types = []
         if highlight_games:
+            needed_types.append("nhl_official")
+        if prof_candidates:
+            needed_types.append("professor_hockey")
+        if needed_types:
+            try:
+                prefetch_channel_uploads(needed_types)
+            except YouTubeQuotaExceeded:
+                logger.warning("⚠️ YouTube API quota exceeded! Skipping video fetch.")
+                quota_exceeded = True
+
+        if highlight_games and not quota_exceeded:
             logger.info(f"✓ Found {len(highlight_games)} games needing highlights")
             for game in highlight_games:
                 try:
@@ -167,11 +190,13 @@ def check_and_fetch_videos_job():
                         home_team=game.home_team,
                         game_date=game.game_date_utc,
                         max_results=3,
+                        video_types=("nhl_official",),
                     )
                     if videos.get('nhl_official'):
                         video_data = videos['nhl_official']
-                        if not video_exists(db, game.game_id, video_data['video_id']):
-                            create_video(db, {
+                        key = (game.game_id, video_data['video_id'])
+                        if key not in existing_videos:
+                            create_videos(db, [{
                                 'game_id': game.game_id,
                                 'youtube_id': video_data['video_id'],
                                 'title': video_data['title'],
@@ -179,7 +204,8 @@ def check_and_fetch_videos_job():
                                 'thumbnail_url': video_data.get('thumbnail_url'),
                                 'video_type': 'nhl_official',
                                 'published_at': video_data.get('published_at'),
-                            })
+                            }])
+                            existing_videos.add(key)
                             logger.info(f"    ✓ Added highlight video for {game.game_id}")
                             videos_added += 1
                     # Mark as fetched (playlist matching succeeded without quota issues)
@@ -193,31 +219,30 @@ def check_and_fetch_videos_job():
 
         # Fetch Professor Hockey for games missing them (skip if quota exceeded)
         if not quota_exceeded:
-            prof_games = get_games_needing_professor_hockey(db, status="FINAL")
-            prof_games += get_games_needing_professor_hockey(db, status="OFF")
+            prof_games = prof_candidates
         else:
             prof_games = []
 
         if prof_games:
             logger.info(f"✓ Found {len(prof_games)} games needing Professor Hockey")
+            sharks_game_numbers = get_sharks_game_numbers(db)
             for game in prof_games:
                 try:
-                    sharks_games_before = db.query(Game).filter(
-                        ((Game.away_team == 'SJS') | (Game.home_team == 'SJS')),
-                        Game.game_date_utc <= game.game_date_utc
-                    ).order_by(Game.game_date_utc).count()
+                    sharks_game_number = sharks_game_numbers.get(game.game_id)
 
                     videos = search_game_highlights(
                         away_team=game.away_team,
                         home_team=game.home_team,
                         game_date=game.game_date_utc,
                         max_results=3,
-                        sharks_game_number=sharks_games_before
+                        sharks_game_number=sharks_game_number,
+                        video_types=("professor_hockey",),
                     )
                     if videos.get('professor_hockey'):
                         video_data = videos['professor_hockey']
-                        if not video_exists(db, game.game_id, video_data['video_id']):
-                            create_video(db, {
+                        key = (game.game_id, video_data['video_id'])
+                        if key not in existing_videos:
+                            create_videos(db, [{
                                 'game_id': game.game_id,
                                 'youtube_id': video_data['video_id'],
                                 'title': video_data['title'],
@@ -225,7 +250,8 @@ def check_and_fetch_videos_job():
                                 'thumbnail_url': video_data.get('thumbnail_url'),
                                 'video_type': 'professor_hockey',
                                 'published_at': video_data.get('published_at'),
-                            })
+                            }])
+                            existing_videos.add(key)
                             logger.info(f"    ✓ Added Professor Hockey video for {game.game_id}")
                             videos_added += 1
                         mark_professor_hockey_fetched(db, game.game_id)
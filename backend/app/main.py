@@ -9,16 +9,36 @@ from app.db.session import SessionLocal
 from app.config import settings
 from app.services.redis_cache import cache
 from app.services.prospect_client import prospect_client
+import atexit
 import logging
+import logging.handlers
+import queue
+import sys
 import time
 import collections
 from datetime import datetime
 
-# Configure logging
+# Configure logging. Records are pushed onto an unbounded queue and written to
+# stdout by a background QueueListener, so request handlers and scheduler jobs
+# never block on stream I/O. force=True replaces the plain handler installed by
+# app.jobs.scheduler's basicConfig, which runs first via the router imports.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+    force=True,
+)
+log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_stream_handler, respect_handler_level=True
 )
+log_listener.start()
+atexit.register(log_listener.stop)
+# httpx logs every request URL at INFO; keep that out of the app logs
+logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # Initialize Sentry (if DSN configured)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime, Index, Text, Boolean
+from sqlalchemy import Column, Integer, String, JSON, DateTime, Index, Text, Boolean, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.db.session import Base
@@ -76,4 +76,11 @@ class Game(Base):
         Index("ix_games_status_updated", "status", "status_updated_at"),
         # Covers the Reddit discovery predicate (status + thread_id NULL + game_date_utc)
         Index("ix_games_reddit_discovery", "status", "reddit_thread_id", "game_date_utc"),
+        # Cover the video pipeline's pending-work predicates
+        Index("ix_games_status_highlights", "status", "highlights_fetched"),
+        Index("ix_games_status_professor_hockey", "status", "professor_hockey_fetched"),
+        # NHL gameType from the raw schedule JSON, for preseason filters
+        # (created in migration b3d9e4f2a1c7). Declared here so autogenerate
+        # doesn't propose dropping it.
+        Index("ix_games_game_type", text("((raw ->> 'gameType')::integer)")),
     )
\ No newline at end of file
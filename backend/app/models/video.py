@@ -29,7 +29,9 @@ class Video(Base):
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
 
     __table_args__ = (
-        # Prevent duplicate videos for same game
+        # Prevent duplicate videos for same game. Postgres backs this with a
+        # unique (game_id, youtube_id) index, which also serves the dedup
+        # probes in crud.video and game_id lookups via its leftmost column.
         UniqueConstraint("game_id", "youtube_id", name="uq_game_video"),
         # Index for fetching videos by type
         Index("ix_videos_game_type", "game_id", "video_type"),
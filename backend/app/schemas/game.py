@@ -57,6 +57,41 @@ class GameDetail(BaseModel):
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_game(cls, game) -> "GameDetail":
+        """Build from a Game ORM row with its videos relationship loaded."""
+        def first_video(video_type: str):
+            return next((v for v in game.videos if v.video_type == video_type), None)
+
+        nhl_video = first_video("nhl_official")
+        prof_video = first_video("professor_hockey")
+
+        return cls(
+            game_id=game.game_id,
+            game_date_utc=game.game_date_utc,
+            status=game.status,
+            away_team=game.away_team,
+            home_team=game.home_team,
+            away_score=game.away_score,
+            home_score=game.home_score,
+            scorers=game.scorers,
+            recap_text=game.recap_text,
+            summary_line=game.summary_line,
+            nhl_video_id=nhl_video.youtube_id if nhl_video else None,
+            professor_hockey_video_id=prof_video.youtube_id if prof_video else None,
+            videos=[
+                {
+                    "id": v.id,
+                    "youtube_id": v.youtube_id,
+                    "title": v.title,
+                    "video_type": v.video_type,
+                    "channel_name": v.channel_name,
+                    "thumbnail_url": v.thumbnail_url
+                }
+                for v in game.videos
+            ]
+        )
+
 
 class GameCreate(BaseModel):
     """Create a new game."""
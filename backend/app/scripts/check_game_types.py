@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Show how stored games break down by NHL gameType (1=preseason, 2=regular, 3=playoffs).
+
+Read-only companion to delete_preseason.py.
+"""
+import sys
+from sqlalchemy import func
+
+from app.db.session import SessionLocal
+from app.models.game import Game
+
+GAME_TYPE_LABELS = {1: "Preseason", 2: "Regular season", 3: "Playoffs"}
+
+
+def main():
+    """Main function."""
+    print("=" * 70)
+    print("🔍 GAME TYPES IN DATABASE")
+    print("=" * 70)
+
+    db = SessionLocal()
+
+    try:
+        # One grouped query; no Game instances are built just to read gameType
+        game_type = Game.raw['gameType'].as_integer()
+        rows = db.query(game_type, func.count()).group_by(game_type).order_by(game_type).all()
+
+        for gt, count in rows:
+            print(f"   {GAME_TYPE_LABELS.get(gt, f'Unknown ({gt})'):16s} {count}")
+
+        # Sample of preseason games as lightweight row tuples
+        preseason = db.query(
+            Game.game_id, Game.away_team, Game.home_team, Game.game_date_utc, Game.status
+        ).filter(game_type == 1).order_by(Game.game_date_utc).limit(5).all()
+
+        if preseason:
+            print("\nFirst preseason games:")
+            for game_id, away, home, game_date, status in preseason:
+                print(f"   {game_id}: {away} @ {home} on {game_date.strftime('%Y-%m-%d')} ({status})")
+            print("\nRun: python -m app.scripts.delete_preseason to remove them.")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
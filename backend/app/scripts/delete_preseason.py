@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Delete preseason games (gameType=1) and their videos from the database.
+
+Schedule syncs only store regular season games now, but older runs stored
+the whole club schedule. Run this once to clean those rows out.
+"""
+import sys
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.game import Game
+from app.models.video import Video
+
+PRESEASON_GAME_TYPE = 1
+
+
+def delete_preseason_games(db: Session) -> int:
+    """
+    Delete all preseason games and their videos.
+
+    The gameType filter runs server-side against the raw schedule JSON and
+    both tables are cleared with one bulk DELETE each. Videos are matched
+    through a subquery, so no game rows or ids are pulled into Python.
+
+    Returns:
+        Number of games deleted
+    """
+    preseason_filter = Game.raw['gameType'].as_integer() == PRESEASON_GAME_TYPE
+    preseason_ids = select(Game.game_id).where(preseason_filter)
+
+    videos_deleted = db.query(Video).filter(
+        Video.game_id.in_(preseason_ids)
+    ).delete(synchronize_session=False)
+
+    games_deleted = db.query(Game).filter(
+        preseason_filter
+    ).delete(synchronize_session=False)
+
+    db.commit()
+    print(f"   ✓ Deleted {videos_deleted} videos")
+    return games_deleted
+
+
+def main():
+    """Main function."""
+    print("=" * 70)
+    print("🗑️  DELETING PRESEASON GAMES")
+    print("=" * 70)
+
+    db = SessionLocal()
+
+    try:
+        deleted = delete_preseason_games(db)
+        print(f"   ✓ Deleted {deleted} preseason games")
+
+    except Exception as e:
+        db.rollback()
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
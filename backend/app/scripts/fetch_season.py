@@ -4,16 +4,24 @@ Fetch all San Jose Sharks games for the 2025-26 season and populate the database
 Also fetches YouTube videos (NHL Official + Professor Hockey) for each completed game.
 """
 import sys
+import logging
+import ijson
 import requests
 from datetime import datetime, date
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from app.db.session import SessionLocal
-from app.services.youtube import search_game_highlights
+from app.services.youtube import (
+    search_game_highlights, prefetch_channel_uploads, YouTubeQuotaExceeded
+)
 from app.models.game import Game
 from app.models.video import Video
-from app.crud.game import get_game_by_id, create_game, update_game
-from app.crud.video import create_video, video_exists
+from app.crud.game import get_game_by_id, create_game, update_game, get_sharks_game_numbers
+from app.crud.video import create_videos, get_existing_video_keys
+from app.schemas.game import GameDetail
+from app.services.redis_cache import cache
+
+logger = logging.getLogger(__name__)
 
 
 def fetch_sharks_season_games(db: Session, season: str = "20252026"):
@@ -25,79 +33,77 @@ def fetch_sharks_season_games(db: Session, season: str = "20252026"):
         db: Database session
         season: Season in format YYYYYYYY (e.g., "20252026" for 2025-26)
     """
-    print(f"🏒 Fetching Sharks schedule for {season[:4]}-{season[4:6]} season...")
+    logger.info(f"🏒 Fetching Sharks schedule for {season[:4]}-{season[4:6]} season...")
 
     # Use official NHL Web API
     url = f"https://api-web.nhle.com/v1/club-schedule-season/SJS/{season}"
 
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
-
-        games_data = data.get('games', [])
-        print(f"✓ Found {len(games_data)} games")
-
+        games_seen = 0
         games_created = 0
         games_updated = 0
 
-        for game_data in games_data:
-            # Skip preseason games (gameType=1), only process regular season (gameType=2)
-            if game_data.get('gameType') != 2:
-                continue
-
-            game_id = game_data.get('id')
-
-            # Parse game date
-            game_date_str = game_data.get('startTimeUTC')
-            if game_date_str:
-                game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-            else:
-                # Fallback to gameDate
-                game_date = datetime.strptime(game_data.get('gameDate', ''), '%Y-%m-%d')
-
-            # Check if game already exists
-            existing_game = get_game_by_id(db, game_id)
-
-            if existing_game:
-                # Update existing game
-                update_data = {
-                    'status': game_data.get('gameState', 'SCHEDULED'),
-                    'away_score': game_data.get('awayTeam', {}).get('score') or 0,  # Default to 0 for future games
-                    'home_score': game_data.get('homeTeam', {}).get('score') or 0,  # Default to 0 for future games
-                }
-                update_game(db, game_id, update_data)
-                games_updated += 1
-            else:
-                # Create new game
-                new_game = {
-                    'game_id': game_id,
-                    'game_date_utc': game_date,
-                    'away_team': game_data.get('awayTeam', {}).get('abbrev', 'UNK'),
-                    'home_team': game_data.get('homeTeam', {}).get('abbrev', 'UNK'),
-                    'away_score': game_data.get('awayTeam', {}).get('score') or 0,  # Default to 0 for future games
-                    'home_score': game_data.get('homeTeam', {}).get('score') or 0,  # Default to 0 for future games
-                    'status': game_data.get('gameState', 'SCHEDULED'),
-                    'scorers': [],
-                    'raw': game_data,
-                }
-                create_game(db, new_game)
-                games_created += 1
-
-        print(f"✓ Created {games_created} new games")
-        print(f"✓ Updated {games_updated} existing games")
+        # Stream the payload and parse one game dict at a time rather than
+        # buffering the whole season with response.json().
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True  # let urllib3 undo gzip
+            for game_data in ijson.items(response.raw, 'games.item', use_float=True):
+                games_seen += 1
+
+                # Skip preseason games (gameType=1), only process regular season (gameType=2)
+                if game_data.get('gameType') != 2:
+                    continue
+
+                game_id = game_data.get('id')
+
+                # Parse game date
+                game_date_str = game_data.get('startTimeUTC')
+                if game_date_str:
+                    game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+                else:
+                    # Fallback to gameDate
+                    game_date = datetime.strptime(game_data.get('gameDate', ''), '%Y-%m-%d')
+
+                # Check if game already exists
+                existing_game = get_game_by_id(db, game_id)
+
+                if existing_game:
+                    # Update existing game
+                    update_data = {
+                        'status': game_data.get('gameState', 'SCHEDULED'),
+                        'away_score': game_data.get('awayTeam', {}).get('score') or 0,  # Default to 0 for future games
+                        'home_score': game_data.get('homeTeam', {}).get('score') or 0,  # Default to 0 for future games
+                    }
+                    update_game(db, game_id, update_data)
+                    games_updated += 1
+                else:
+                    # Create new game
+                    new_game = {
+                        'game_id': game_id,
+                        'game_date_utc': game_date,
+                        'away_team': game_data.get('awayTeam', {}).get('abbrev', 'UNK'),
+                        'home_team': game_data.get('homeTeam', {}).get('abbrev', 'UNK'),
+                        'away_score': game_data.get('awayTeam', {}).get('score') or 0,  # Default to 0 for future games
+                        'home_score': game_data.get('homeTeam', {}).get('score') or 0,  # Default to 0 for future games
+                        'status': game_data.get('gameState', 'SCHEDULED'),
+                        'scorers': [],
+                        'raw': game_data,
+                    }
+                    create_game(db, new_game)
+                    games_created += 1
+
+        logger.info(f"✓ Found {games_seen} games")
+        logger.info(f"✓ Created {games_created} new games")
+        logger.info(f"✓ Updated {games_updated} existing games")
 
         return games_created + games_updated
 
     except requests.exceptions.RequestException as e:
-        print(f"❌ Error fetching schedule from NHL API: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Error fetching schedule from NHL API: {e}")
         return 0
     except Exception as e:
-        print(f"❌ Error processing schedule: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Error processing schedule: {e}")
         return 0
 
 
@@ -109,7 +115,7 @@ def fetch_videos_for_completed_games(db: Session, limit: int = 10):
         db: Database session
         limit: Maximum number of games to process
     """
-    print(f"\n🎥 Fetching videos for completed games...")
+    logger.info("🎥 Fetching videos for completed games...")
 
     # Get completed games missing either video type
     games = db.query(Game).filter(
@@ -118,26 +124,36 @@ def fetch_videos_for_completed_games(db: Session, limit: int = 10):
     ).order_by(Game.game_date_utc.desc()).limit(limit).all()
 
     if not games:
-        print("✓ No games need video processing")
+        logger.info("✓ No games need video processing")
         return 0
 
-    print(f"✓ Found {len(games)} games needing videos")
+    logger.info(f"✓ Found {len(games)} games needing videos")
 
     videos_found = 0
 
+    # Prefetch stored videos for the whole batch instead of one
+    # existence query per candidate.
+    existing_videos = get_existing_video_keys(db, [g.game_id for g in games])
+    sharks_game_numbers = get_sharks_game_numbers(db)
+
+    # Warm the upload lists these games still need, concurrently
+    needed_types = set()
+    if any(not g.highlights_fetched for g in games):
+        needed_types.add('nhl_official')
+    if any(not g.professor_hockey_fetched for g in games):
+        needed_types.add('professor_hockey')
+    try:
+        prefetch_channel_uploads(needed_types)
+    except YouTubeQuotaExceeded:
+        logger.warning("⚠️ YouTube API quota exceeded! Skipping video fetch.")
+        return 0
+
     for idx, game in enumerate(games):
-        print(f"\n  Processing game {game.game_id}: {game.away_team} @ {game.home_team}")
+        logger.info(f"  Processing game {game.game_id}: {game.away_team} @ {game.home_team}")
 
         try:
             # Calculate Sharks game number for the season
-            # Get all Sharks games up to this date, ordered by date
-            sharks_games_before = db.query(Game).filter(
-                ((Game.away_team == 'SJS') | (Game.home_team == 'SJS')),
-                Game.game_date_utc <= game.game_date_utc,
-                Game.status.in_(['FINAL', 'OFF', 'LIVE', 'SCHEDULED', 'FUT'])
-            ).order_by(Game.game_date_utc).all()
-
-            sharks_game_number = len(sharks_games_before)
+            sharks_game_number = sharks_game_numbers.get(game.game_id)
 
             # Search for videos
             videos = search_game_highlights(
@@ -148,39 +164,29 @@ def fetch_videos_for_completed_games(db: Session, limit: int = 10):
                 sharks_game_number=sharks_game_number
             )
 
-            print(f"    Sharks game #{sharks_game_number} of season")
-
-            # Store NHL Official video
-            if videos.get('nhl_official'):
-                video_data = videos['nhl_official']
-                if not video_exists(db, game.game_id, video_data['video_id']):
-                    create_video(db, {
-                        'game_id': game.game_id,
-                        'youtube_id': video_data['video_id'],
-                        'title': video_data['title'],
-                        'channel_name': video_data.get('channel_name', 'NHL'),
-                        'thumbnail_url': video_data.get('thumbnail_url'),
-                        'video_type': 'nhl_official',
-                        'published_at': video_data.get('published_at'),
-                    })
-                    print(f"    ✓ Added NHL Official video: {video_data['video_id']}")
-                    videos_found += 1
-
-            # Store Professor Hockey video
-            if videos.get('professor_hockey'):
-                video_data = videos['professor_hockey']
-                if not video_exists(db, game.game_id, video_data['video_id']):
-                    create_video(db, {
-                        'game_id': game.game_id,
-                        'youtube_id': video_data['video_id'],
-                        'title': video_data['title'],
-                        'channel_name': video_data.get('channel_name', 'Professor Hockey'),
-                        'thumbnail_url': video_data.get('thumbnail_url'),
-                        'video_type': 'professor_hockey',
-                        'published_at': video_data.get('published_at'),
-                    })
-                    print(f"    ✓ Added Professor Hockey video: {video_data['video_id']}")
-                    videos_found += 1
+            logger.info(f"    Sharks game #{sharks_game_number} of season")
+
+            # Collect new videos for this game and insert them in one statement
+            new_videos = []
+            for video_type, default_channel in (('nhl_official', 'NHL'),
+                                                ('professor_hockey', 'Professor Hockey')):
+                video_data = videos.get(video_type)
+                if not video_data or (game.game_id, video_data['video_id']) in existing_videos:
+                    continue
+                new_videos.append({
+                    'game_id': game.game_id,
+                    'youtube_id': video_data['video_id'],
+                    'title': video_data['title'],
+                    'channel_name': video_data.get('channel_name', default_channel),
+                    'thumbnail_url': video_data.get('thumbnail_url'),
+                    'video_type': video_type,
+                    'published_at': video_data.get('published_at'),
+                })
+
+            videos_found += create_videos(db, new_videos)
+            for row in new_videos:
+                existing_videos.add((game.game_id, row['youtube_id']))
+                logger.info(f"    ✓ Added {row['video_type']} video: {row['youtube_id']}")
 
             # Mark each video type as fetched independently
             if videos.get('nhl_official'):
@@ -192,18 +198,47 @@ def fetch_videos_for_completed_games(db: Session, limit: int = 10):
             db.commit()
 
         except Exception as e:
-            print(f"    ❌ Error fetching videos: {e}")
+            logger.error(f"    ❌ Error fetching videos for {game.game_id}: {e}")
             continue
 
-    print(f"\n✓ Found and stored {videos_found} videos")
+    logger.info(f"✓ Found and stored {videos_found} videos")
     return videos_found
 
 
+def warm_game_cache(db: Session, ttl: int = 300) -> int:
+    """
+    Pre-populate the per-game detail cache for completed games.
+
+    Writes the same payload GET /api/games/{id} caches, pipelined in one
+    Redis round trip. No-op when Redis is disabled.
+
+    Args:
+        db: Database session
+        ttl: Cache TTL in seconds (matches the games router)
+    """
+    if not cache.enabled:
+        return 0
+
+    # COMPLETE is the terminal status once a game is fully processed
+    games = db.query(Game).options(joinedload(Game.videos)).filter(
+        Game.status.in_(['FINAL', 'OFF', 'COMPLETE'])
+    ).all()
+
+    entries = {
+        f"game:{game.game_id}": (GameDetail.from_game(game).model_dump(), ttl)
+        for game in games
+    }
+    warmed = cache.warm(entries)
+    if warmed:
+        logger.info(f"✓ Warmed cache for {warmed} games")
+    return warmed
+
+
 def main():
     """Main function."""
-    print("=" * 70)
-    print("🦈 San Jose Sharks - Season Data Fetcher")
-    print("=" * 70)
+    logger.info("=" * 70)
+    logger.info("🦈 San Jose Sharks - Season Data Fetcher")
+    logger.info("=" * 70)
 
     db = SessionLocal()
 
@@ -214,19 +249,19 @@ def main():
         # Fetch videos for completed games
         if total_games > 0:
             videos_found = fetch_videos_for_completed_games(db, limit=82)
+            warm_game_cache(db)
 
-        print("\n" + "=" * 70)
-        print("✅ Season data fetch complete!")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("✅ Season data fetch complete!")
+        logger.info("=" * 70)
 
     except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Error: {e}")
         sys.exit(1)
     finally:
         db.close()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     main()
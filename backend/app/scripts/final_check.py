@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Summarize video coverage after a season backfill (fetch_season.py).
+"""
+import sys
+
+from app.db.session import SessionLocal
+from app.crud.game import get_video_progress
+from app.crud.video import get_video_type_counts
+from app.models.game import Game
+from app.models.video import Video
+
+
+def main():
+    """Main function."""
+    print("=" * 70)
+    print("📊 VIDEO BACKFILL SUMMARY")
+    print("=" * 70)
+
+    db = SessionLocal()
+
+    try:
+        # All counters come back from one query
+        progress = get_video_progress(db)
+        completed = progress["completed"]
+
+        print(f"Completed games:          {completed}")
+        print(f"Highlights fetched:       {progress['highlights_fetched']}/{completed}")
+        print(f"Professor Hockey fetched: {progress['professor_hockey_fetched']}/{completed}")
+        print(f"Total videos:             {progress['videos']}")
+
+        # Per-type breakdown from a single GROUP BY
+        for video_type, count in sorted(get_video_type_counts(db).items()):
+            print(f"   {video_type:22s} {count}")
+
+        # Sample of the latest videos, with their game, in one joined query.
+        # Only the printed columns are selected, so no ORM instances are built.
+        latest = db.query(
+            Video.video_type, Video.youtube_id,
+            Game.away_team, Game.home_team, Game.game_date_utc
+        ).join(
+            Game, Video.game_id == Game.game_id
+        ).order_by(Game.game_date_utc.desc()).limit(5).all()
+
+        if latest:
+            print("\nLatest videos:")
+            for video_type, youtube_id, away, home, game_date in latest:
+                print(f"   {game_date.strftime('%Y-%m-%d')} {away} @ {home} "
+                      f"[{video_type}] https://youtu.be/{youtube_id}")
+
+        pending = completed - min(progress["highlights_fetched"], progress["professor_hockey_fetched"])
+        if pending > 0:
+            print(f"\n⚠️  Up to {pending} games still need videos — run: python -m app.scripts.fetch_season")
+        else:
+            print("\n✅ All completed games have been processed")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Watch video backfill progress while fetch_season.py is running.
+
+Prints one status line every few seconds until every completed game has
+both video flags set (or Ctrl-C).
+"""
+import sys
+import time
+
+from app.db.session import SessionLocal
+from app.crud.game import get_video_progress
+
+POLL_SECONDS = 5
+
+
+def main():
+    """Main function."""
+    print("📈 Watching video backfill progress (Ctrl-C to stop)...")
+
+    db = SessionLocal()
+
+    try:
+        while True:
+            progress = get_video_progress(db)
+            # End the read transaction so we don't sit idle-in-transaction
+            # between ticks; the connection goes back to the engine pool and
+            # is reused (no reconnect) on the next tick.
+            db.commit()
+
+            completed = progress["completed"]
+            print(
+                f"   Completed games: {completed} | "
+                f"highlights: {progress['highlights_fetched']}/{completed} | "
+                f"Professor Hockey: {progress['professor_hockey_fetched']}/{completed} | "
+                f"videos: {progress['videos']}"
+            )
+
+            if progress["videos_fetched"] >= completed:
+                print("✅ All completed games have been processed")
+                break
+
+            time.sleep(POLL_SECONDS)
+
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
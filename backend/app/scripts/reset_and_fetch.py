@@ -3,14 +3,17 @@
 Reset database and fetch ONLY 2025-26 regular season games.
 """
 import sys
+import ijson
 import requests
 from datetime import datetime
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
 from app.models.game import Game
 from app.models.video import Video
-from app.crud.game import create_game
+
+INSERT_CHUNK_SIZE = 500
 
 print("="*70)
 print("🗑️  CLEARING DATABASE AND FETCHING 2025-26 SEASON")
@@ -19,62 +22,72 @@ print("="*70)
 db = SessionLocal()
 
 try:
-    # Step 1: Delete all videos
-    print("\n1. Deleting all videos...")
+    # Steps 1-2: Wipe videos and games. TRUNCATE drops the table storage in
+    # one statement instead of deleting (and WAL-logging) row by row. CASCADE
+    # also empties the tables keyed on games (players, comments, quotes,
+    # milestones) — the same rows their ON DELETE CASCADE FKs removed before.
+    print("\n1. Deleting all videos and games...")
     video_count = db.query(Video).count()
-    db.query(Video).delete()
-    db.commit()
-    print(f"   ✓ Deleted {video_count} videos")
-
-    # Step 2: Delete all games
-    print("\n2. Deleting all games...")
     game_count = db.query(Game).count()
-    db.query(Game).delete()
+    db.execute(text("TRUNCATE TABLE videos, games RESTART IDENTITY CASCADE"))
     db.commit()
+    print(f"   ✓ Deleted {video_count} videos")
     print(f"   ✓ Deleted {game_count} games")
 
     # Step 3: Fetch ONLY regular season games (gameType=2)
     print("\n3. Fetching 2025-26 regular season games...")
     url = "https://api-web.nhle.com/v1/club-schedule-season/SJS/20252026"
 
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
-
-    games_data = data.get('games', [])
-    print(f"   ✓ Found {len(games_data)} total games from API")
-
-    # Filter for ONLY regular season (gameType = 2)
-    regular_season_games = [g for g in games_data if g.get('gameType') == 2]
-    print(f"   ✓ Filtered to {len(regular_season_games)} regular season games")
-
+    # Stream the schedule with ijson and insert regular season games in
+    # chunks as they are parsed: one multi-row INSERT per chunk instead of a
+    # create_game() round trip per game, without buffering the whole payload.
+    games_found = 0
     games_created = 0
+    rows = []
+
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # let urllib3 undo gzip
+
+        for game_data in ijson.items(response.raw, 'games.item', use_float=True):
+            games_found += 1
+
+            # Keep ONLY regular season (gameType = 2)
+            if game_data.get('gameType') != 2:
+                continue
+
+            game_id = game_data.get('id')
+
+            # Parse game date
+            game_date_str = game_data.get('startTimeUTC')
+            if game_date_str:
+                game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
+            else:
+                game_date = datetime.strptime(game_data.get('gameDate', ''), '%Y-%m-%d')
+
+            rows.append({
+                'game_id': game_id,
+                'game_date_utc': game_date,
+                'away_team': game_data.get('awayTeam', {}).get('abbrev', 'UNK'),
+                'home_team': game_data.get('homeTeam', {}).get('abbrev', 'UNK'),
+                'away_score': game_data.get('awayTeam', {}).get('score') or 0,  # Default to 0 for future games
+                'home_score': game_data.get('homeTeam', {}).get('score') or 0,  # Default to 0 for future games
+                'status': game_data.get('gameState', 'SCHEDULED'),
+                'scorers': [],
+                'raw': game_data,
+            })
+
+            if len(rows) >= INSERT_CHUNK_SIZE:
+                db.execute(Game.__table__.insert(), rows)
+                games_created += len(rows)
+                rows = []
+
+    if rows:
+        db.execute(Game.__table__.insert(), rows)
+        games_created += len(rows)
+    db.commit()
 
-    for game_data in regular_season_games:
-        game_id = game_data.get('id')
-
-        # Parse game date
-        game_date_str = game_data.get('startTimeUTC')
-        if game_date_str:
-            game_date = datetime.fromisoformat(game_date_str.replace('Z', '+00:00'))
-        else:
-            game_date = datetime.strptime(game_data.get('gameDate', ''), '%Y-%m-%d')
-
-        # Create new game
-        new_game = {
-            'game_id': game_id,
-            'game_date_utc': game_date,
-            'away_team': game_data.get('awayTeam', {}).get('abbrev', 'UNK'),
-            'home_team': game_data.get('homeTeam', {}).get('abbrev', 'UNK'),
-            'away_score': game_data.get('awayTeam', {}).get('score') or 0,  # Default to 0 for future games
-            'home_score': game_data.get('homeTeam', {}).get('score') or 0,  # Default to 0 for future games
-            'status': game_data.get('gameState', 'SCHEDULED'),
-            'scorers': [],
-            'raw': game_data,
-        }
-        create_game(db, new_game)
-        games_created += 1
-
+    print(f"   ✓ Found {games_found} total games from API")
     print(f"   ✓ Created {games_created} regular season games")
 
     # Step 4: Show stats
@@ -91,8 +104,9 @@ try:
     print(f"Upcoming games: {future_games}")
 
     # Show first and last game
-    first_game = db.query(Game).order_by(Game.game_date_utc).first()
-    last_game = db.query(Game).order_by(Game.game_date_utc.desc()).first()
+    game_summary = db.query(Game.away_team, Game.home_team, Game.game_date_utc)
+    first_game = game_summary.order_by(Game.game_date_utc).first()
+    last_game = game_summary.order_by(Game.game_date_utc.desc()).first()
 
     if first_game:
         print(f"\nFirst game: {first_game.away_team} @ {first_game.home_team} on {first_game.game_date_utc.strftime('%Y-%m-%d')}")
@@ -1,257 +1,290 @@
 """
 Test script for validating NHL API services with real Sharks data.
 Run this to verify all integrations are working.
+
+App, database and service imports happen inside main(), so importing this
+module (e.g. during test collection) doesn't load settings or API clients.
 """
 
+import contextlib
+import io
+import logging
+import os
 import sys
 from datetime import date, datetime
-from app.db.session import SessionLocal
-from app.jobs.roster_sync import sync_sharks_roster, get_current_roster
-from app.config import settings
-
-# Import services directly
-from app.services import (
-    fetch_team_schedule,
-    fetch_boxscore,
-    fetch_current_roster,
-    fetch_standings
-)
-
-print("=" * 70)
-print("🏒 SHARKS FAN HUB - API TESTING SUITE")
-print("=" * 70)
-
-# Test 1: Fetch Sharks Schedule
-print("\n📅 TEST 1: Fetching Sharks Schedule")
-print("-" * 70)
-try:
-    games = fetch_team_schedule('SJS', start_date=date.today())
-    print(f"✓ Found {len(games)} upcoming Sharks games")
-
-    if games:
-        game = games[0]
-        print(f"\nNext game:")
-        print(f"  Game ID: {game['id']}")
-        print(f"  Date: {game['gameDate']}")
-        print(f"  Matchup: {game['awayTeam']['abbrev']} @ {game['homeTeam']['abbrev']}")
-        print(f"  Status: {game['gameState']}")
-
-        # Store game ID for later tests
-        test_game_id = game['id']
-    else:
-        print("⚠️  No upcoming games found (off-season?)")
-        # Use a recent game ID for testing
-        test_game_id = 2024020206
-        print(f"   Using test game ID: {test_game_id}")
-
-except Exception as e:
-    print(f"❌ Error: {e}")
-    sys.exit(1)
-
-# Test 2: Fetch Game Boxscore
-print("\n\n📊 TEST 2: Fetching Game Boxscore")
-print("-" * 70)
-try:
-    # Try to fetch a recent completed game
-    # This game ID is from October 2024
-    boxscore = fetch_boxscore(test_game_id)
-
-    away = boxscore['awayTeam']
-    home = boxscore['homeTeam']
-
-    print(f"✓ Boxscore fetched successfully")
-    print(f"\nGame Details:")
-    print(f"  {away['commonName']['default']} ({away['abbrev']}): {away['score']}")
-    print(f"  {home['commonName']['default']} ({home['abbrev']}): {home['score']}")
-    print(f"  Status: {boxscore.get('gameState', 'Unknown')}")
-
-    # Extract goal scorers
-    stats = boxscore.get('playerByGameStats', {})
-    scorers = []
-    for side in ('awayTeam', 'homeTeam'):
-        for role in ('forwards', 'defense'):
-            for player in stats.get(side, {}).get(role, []):
-                if player.get('goals', 0) > 0:
-                    name = player.get('name', {}).get('default')
-                    goals = player.get('goals')
-                    if name:
-                        scorers.append(f"{name} ({goals}G)")
-
-    if scorers:
-        print(f"\n  Goal Scorers:")
-        for scorer in scorers[:5]:  # Top 5
-            print(f"    - {scorer}")
-
-except Exception as e:
-    print(f"❌ Error: {e}")
-    print(f"   (This is OK if game {test_game_id} doesn't exist)")
-
-# Test 3: Fetch Current Roster
-print("\n\n👥 TEST 3: Fetching Current Sharks Roster")
-print("-" * 70)
-try:
-    roster_data = fetch_current_roster('SJS')
-
-    forwards = roster_data.get('forwards', [])
-    defensemen = roster_data.get('defensemen', [])
-    goalies = roster_data.get('goalies', [])
-
-    print(f"✓ Roster fetched successfully")
-    print(f"\nRoster Summary:")
-    print(f"  Forwards: {len(forwards)}")
-    print(f"  Defensemen: {len(defensemen)}")
-    print(f"  Goalies: {len(goalies)}")
-    print(f"  Total: {len(forwards) + len(defensemen) + len(goalies)} players")
-
-    print(f"\nSample Players:")
-    for player in forwards[:3]:
-        print(f"  F - #{player.get('sweaterNumber')} {player['firstName']['default']} {player['lastName']['default']}")
-
-except Exception as e:
-    print(f"❌ Error: {e}")
-    sys.exit(1)
-
-# Test 4: Roster Sync (Database)
-print("\n\n🔄 TEST 4: Syncing Roster to Database")
-print("-" * 70)
-try:
-    db = SessionLocal()
-
-    changes = sync_sharks_roster(db)
-    print(f"✓ Roster sync complete: {changes} changes")
-
-    # Get current roster from database
-    roster = get_current_roster(db, "SJS")
-    print(f"\nDatabase Roster: {len(roster)} players")
-
-    print("\nFirst 5 players in database:")
-    for player in roster[:5]:
-        print(f"  #{player['jersey_number']:2d} {player['name']:25s} ({player['position']})")
-
-    db.close()
-
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
-
-# Test 5: Fetch Standings
-print("\n\n📊 TEST 5: Fetching NHL Standings")
-print("-" * 70)
-try:
-    standings_data = fetch_standings()
-
-    # Find Pacific Division
-    pacific = None
-    for standing in standings_data.get('standings', []):
-        if standing.get('divisionName') == 'Pacific':
-            pacific = standing
-            break
-
-    if pacific:
-        print(f"✓ Standings fetched successfully")
-        print(f"\nPacific Division Standings:")
-        print(f"  {'Team':<20} {'GP':>4} {'W':>3} {'L':>3} {'OT':>3} {'PTS':>4}")
-        print(f"  {'-'*20} {'-'*4} {'-'*3} {'-'*3} {'-'*3} {'-'*4}")
-
-        teams = pacific.get('teams', [])[:8]  # Top 8
-        for team in teams:
-            abbrev = team.get('teamAbbrev', {}).get('default', 'UNK')
-            gp = team.get('gamesPlayed', 0)
-            w = team.get('wins', 0)
-            l = team.get('losses', 0)
-            ot = team.get('otLosses', 0)
-            pts = team.get('points', 0)
-
-            marker = "→" if abbrev == "SJS" else " "
-            print(f"{marker} {abbrev:<20} {gp:>4} {w:>3} {l:>3} {ot:>3} {pts:>4}")
-
-except Exception as e:
-    print(f"❌ Error: {e}")
-
-# Test 6: YouTube Search (Optional - requires API key)
-print("\n\n🎬 TEST 6: YouTube Video Search (Optional)")
-print("-" * 70)
-if settings.YOUTUBE_API_KEY:
+
+logger = logging.getLogger(__name__)
+
+
+def _run_checks():
+    """Run every service check, printing the report as it goes."""
+    from app.config import settings
+    from app.db.session import SessionLocal
+    from app.jobs.roster_sync import sync_sharks_roster, get_current_roster
+
+    # Import services directly
+    from app.services import (
+        fetch_team_schedule,
+        fetch_boxscore,
+        fetch_current_roster,
+        fetch_standings
+    )
+
+    # Tracebacks go through logging; set TEST_SERVICES_LOG=CRITICAL (e.g. in CI)
+    # to skip formatting them and keep just the one-line error prints.
+    logging.basicConfig(level=os.environ.get("TEST_SERVICES_LOG", "INFO"), format="%(message)s")
+
+    print("=" * 70)
+    print("🏒 SHARKS FAN HUB - API TESTING SUITE")
+    print("=" * 70)
+
+    # Test 1: Fetch Sharks Schedule
+    print("\n📅 TEST 1: Fetching Sharks Schedule")
+    print("-" * 70)
     try:
-        from app.services.youtube import search_game_highlights
-
-        # Search for recent Sharks game
-        videos = search_game_highlights(
-            away_team="Ducks",
-            home_team="Sharks",
-            game_date=datetime(2024, 10, 20),
-            max_results=2
-        )
-
-        print("✓ YouTube search completed")
-        print(f"\nResults:")
-        print(f"  NHL Official: {videos.get('nhl_official') or 'Not found'}")
-        print(f"  Professor Hockey: {videos.get('professor_hockey') or 'Not found'}")
-        print(f"  Other highlights: {len(videos.get('other_highlights', []))} found")
+        games = fetch_team_schedule('SJS', start_date=date.today())
+        print(f"✓ Found {len(games)} upcoming Sharks games")
+
+        if games:
+            game = games[0]
+            print(f"\nNext game:")
+            print(f"  Game ID: {game['id']}")
+            print(f"  Date: {game['gameDate']}")
+            print(f"  Matchup: {game['awayTeam']['abbrev']} @ {game['homeTeam']['abbrev']}")
+            print(f"  Status: {game['gameState']}")
+
+            # Store game ID for later tests
+            test_game_id = game['id']
+        else:
+            print("⚠️  No upcoming games found (off-season?)")
+            # Use a recent game ID for testing
+            test_game_id = 2024020206
+            print(f"   Using test game ID: {test_game_id}")
 
     except Exception as e:
-        print(f"❌ Error: {e}")
-else:
-    print("⚠️  Skipped - No YouTube API key configured")
-    print("   Set YOUTUBE_API_KEY in .env to test this feature")
-
-# Test 7: Claude Recap (Optional - requires API key)
-print("\n\n🤖 TEST 7: Claude AI Recap Generation (Optional)")
-print("-" * 70)
-if settings.CLAUDE_API_KEY:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Test 2: Fetch Game Boxscore
+    print("\n\n📊 TEST 2: Fetching Game Boxscore")
+    print("-" * 70)
     try:
-        from app.services.claude import generate_game_recap
-
-        recap = generate_game_recap(
-            game_data={
-                "away_team": "Ducks",
-                "home_team": "Sharks",
-                "away_score": 2,
-                "home_score": 5,
-                "game_date": "October 20, 2024"
-            },
-            goal_details=[
-                {"period": 1, "time": "5:23", "scorer": "Eklund", "team": "SJS", "assists": ["Granlund", "Couture"]},
-                {"period": 2, "time": "12:45", "scorer": "Couture", "team": "SJS", "assists": ["Smith"]}
-            ],
-            top_performers=[
-                {"name": "William Eklund", "goals": 2, "assists": 1, "position": "F"},
-                {"name": "Mackenzie Blackwood", "saves": 28, "save_percentage": ".933", "position": "G"}
-            ]
-        )
-
-        print("✓ Claude recap generated successfully")
-        print(f"\nSummary Line:")
-        print(f"  {recap['summary_line']}")
-        print(f"\nRecap Preview (first 200 chars):")
-        print(f"  {recap['recap_text'][:200]}...")
+        # Try to fetch a recent completed game
+        # This game ID is from October 2024
+        boxscore = fetch_boxscore(test_game_id)
+
+        away = boxscore['awayTeam']
+        home = boxscore['homeTeam']
+
+        print(f"✓ Boxscore fetched successfully")
+        print(f"\nGame Details:")
+        print(f"  {away['commonName']['default']} ({away['abbrev']}): {away['score']}")
+        print(f"  {home['commonName']['default']} ({home['abbrev']}): {home['score']}")
+        print(f"  Status: {boxscore.get('gameState', 'Unknown')}")
+
+        # Extract goal scorers
+        stats = boxscore.get('playerByGameStats', {})
+        scorers = [
+            f"{p['name']['default']} ({p['goals']}G)"
+            for side in ('awayTeam', 'homeTeam')
+            for role in ('forwards', 'defense')
+            for p in stats.get(side, {}).get(role, ())
+            if p.get('goals', 0) > 0 and p.get('name', {}).get('default')
+        ]
+
+        if scorers:
+            print(f"\n  Goal Scorers:")
+            for scorer in scorers[:5]:  # Top 5
+                print(f"    - {scorer}")
 
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-else:
-    print("⚠️  Skipped - No Claude API key configured")
-    print("   Set CLAUDE_API_KEY in .env to test this feature")
-
-# Summary
-print("\n\n" + "=" * 70)
-print("📋 TEST SUMMARY")
-print("=" * 70)
-print("✅ NHL API Services: Working")
-print("✅ Database Operations: Working")
-print("✅ Roster Sync: Working")
-
-if settings.YOUTUBE_API_KEY:
-    print("✅ YouTube Integration: Configured")
-else:
-    print("⚠️  YouTube Integration: Not configured (optional)")
-
-if settings.CLAUDE_API_KEY:
-    print("✅ Claude AI: Configured")
-else:
-    print("⚠️  Claude AI: Not configured (optional)")
-
-print("\n🎉 Core functionality is working! Ready for production.")
-print("=" * 70)
\ No newline at end of file
+        print(f"❌ Error: {e}", file=sys.stderr)
+        print(f"   (This is OK if game {test_game_id} doesn't exist)", file=sys.stderr)
+
+    # Test 3: Fetch Current Roster
+    print("\n\n👥 TEST 3: Fetching Current Sharks Roster")
+    print("-" * 70)
+    try:
+        roster_data = fetch_current_roster('SJS')
+
+        forwards = roster_data.get('forwards', [])
+        defensemen = roster_data.get('defensemen', [])
+        goalies = roster_data.get('goalies', [])
+
+        print(f"✓ Roster fetched successfully")
+        print(f"\nRoster Summary:")
+        print(f"  Forwards: {len(forwards)}")
+        print(f"  Defensemen: {len(defensemen)}")
+        print(f"  Goalies: {len(goalies)}")
+        print(f"  Total: {len(forwards) + len(defensemen) + len(goalies)} players")
+
+        print(f"\nSample Players:")
+        for player in forwards[:3]:
+            print(f"  F - #{player.get('sweaterNumber')} {player['firstName']['default']} {player['lastName']['default']}")
+
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # Test 4: Roster Sync (Database)
+    print("\n\n🔄 TEST 4: Syncing Roster to Database")
+    print("-" * 70)
+    try:
+        db = SessionLocal()
+
+        changes = sync_sharks_roster(db)
+        print(f"✓ Roster sync complete: {changes} changes")
+
+        # Get current roster from database
+        roster = get_current_roster(db, "SJS")
+        print(f"\nDatabase Roster: {len(roster)} players")
+
+        print("\nFirst 5 players in database:")
+        for player in roster[:5]:
+            print(f"  #{player['jersey_number']:2d} {player['name']:25s} ({player['position']})")
+
+        db.close()
+
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        logger.exception("Roster sync failed")
+
+    # Test 5: Fetch Standings
+    print("\n\n📊 TEST 5: Fetching NHL Standings")
+    print("-" * 70)
+    try:
+        standings_data = fetch_standings()
+
+        # Find Pacific Division
+        pacific = None
+        for standing in standings_data.get('standings', []):
+            if standing.get('divisionName') == 'Pacific':
+                pacific = standing
+                break
+
+        if pacific:
+            print(f"✓ Standings fetched successfully")
+            print(f"\nPacific Division Standings:")
+            print(f"  {'Team':<20} {'GP':>4} {'W':>3} {'L':>3} {'OT':>3} {'PTS':>4}")
+            print(f"  {'-'*20} {'-'*4} {'-'*3} {'-'*3} {'-'*3} {'-'*4}")
+
+            teams = pacific.get('teams', [])[:8]  # Top 8
+            for team in teams:
+                abbrev = team.get('teamAbbrev', {}).get('default', 'UNK')
+                gp = team.get('gamesPlayed', 0)
+                w = team.get('wins', 0)
+                l = team.get('losses', 0)
+                ot = team.get('otLosses', 0)
+                pts = team.get('points', 0)
+
+                marker = "→" if abbrev == "SJS" else " "
+                print(f"{marker} {abbrev:<20} {gp:>4} {w:>3} {l:>3} {ot:>3} {pts:>4}")
+
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+
+    # Test 6: YouTube Search (Optional - requires API key)
+    print("\n\n🎬 TEST 6: YouTube Video Search (Optional)")
+    print("-" * 70)
+    if settings.YOUTUBE_API_KEY:
+        try:
+            from app.services.youtube import search_game_highlights
+
+            # Search for recent Sharks game
+            videos = search_game_highlights(
+                away_team="Ducks",
+                home_team="Sharks",
+                game_date=datetime(2024, 10, 20),
+                max_results=2
+            )
+
+            print("✓ YouTube search completed")
+            print(f"\nResults:")
+            print(f"  NHL Official: {videos.get('nhl_official') or 'Not found'}")
+            print(f"  Professor Hockey: {videos.get('professor_hockey') or 'Not found'}")
+            print(f"  Other highlights: {len(videos.get('other_highlights', []))} found")
+
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+    else:
+        print("⚠️  Skipped - No YouTube API key configured")
+        print("   Set YOUTUBE_API_KEY in .env to test this feature")
+
+    # Test 7: Claude Recap (Optional - requires API key)
+    print("\n\n🤖 TEST 7: Claude AI Recap Generation (Optional)")
+    print("-" * 70)
+    if settings.CLAUDE_API_KEY:
+        try:
+            from app.services.claude import generate_game_recap
+
+            recap = generate_game_recap(
+                game_data={
+                    "away_team": "Ducks",
+                    "home_team": "Sharks",
+                    "away_score": 2,
+                    "home_score": 5,
+                    "game_date": "October 20, 2024"
+                },
+                goal_details=[
+                    {"period": 1, "time": "5:23", "scorer": "Eklund", "team": "SJS", "assists": ["Granlund", "Couture"]},
+                    {"period": 2, "time": "12:45", "scorer": "Couture", "team": "SJS", "assists": ["Smith"]}
+                ],
+                top_performers=[
+                    {"name": "William Eklund", "goals": 2, "assists": 1, "position": "F"},
+                    {"name": "Mackenzie Blackwood", "saves": 28, "save_percentage": ".933", "position": "G"}
+                ]
+            )
+
+            print("✓ Claude recap generated successfully")
+            print(f"\nSummary Line:")
+            print(f"  {recap['summary_line']}")
+            print(f"\nRecap Preview (first 200 chars):")
+            print(f"  {recap['recap_text'][:200]}...")
+
+        except Exception as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            logger.exception("Claude recap generation failed")
+    else:
+        print("⚠️  Skipped - No Claude API key configured")
+        print("   Set CLAUDE_API_KEY in .env to test this feature")
+
+    # Summary
+    print("\n\n" + "=" * 70)
+    print("📋 TEST SUMMARY")
+    print("=" * 70)
+    print("✅ NHL API Services: Working")
+    print("✅ Database Operations: Working")
+    print("✅ Roster Sync: Working")
+
+    if settings.YOUTUBE_API_KEY:
+        print("✅ YouTube Integration: Configured")
+    else:
+        print("⚠️  YouTube Integration: Not configured (optional)")
+
+    if settings.CLAUDE_API_KEY:
+        print("✅ Claude AI: Configured")
+    else:
+        print("⚠️  Claude AI: Not configured (optional)")
+
+    print("\n🎉 Core functionality is working! Ready for production.")
+    print("=" * 70)
+
+
+def main():
+    """Main function.
+
+    The report is collected in memory and written with one write at the end
+    (also on sys.exit), rather than a write per print(). Errors still go
+    straight to stderr so they show up even if the run dies early.
+    """
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            _run_checks()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,38 @@
 """NHL API service - fetches data from NHL Stats API."""
 
-import requests
-from datetime import datetime, date
+import httpx
+from datetime import datetime, date, timedelta
 from app.schemas.recap import Recap
 
+NHL_API_BASE_URL = "https://api-web.nhle.com"
+NHL_API_TIMEOUT = 10  # seconds
+
+# Shared HTTP/2 client: every call to api-web.nhle.com rides one pooled,
+# multiplexed connection instead of a fresh TCP + TLS handshake per request.
+# Failed connection attempts are retried; HTTP error statuses are not.
+_client = httpx.Client(
+    base_url=NHL_API_BASE_URL,
+    headers={"User-Agent": "nhl-faninsights/1.0"},
+    timeout=NHL_API_TIMEOUT,
+    follow_redirects=True,  # the ".../now" endpoints redirect to dated URLs
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+    ),
+)
+
+# In-memory boxscore cache keyed by game_id. Once a game is OFF (official,
+# stat corrections applied) its boxscore never changes, so those entries never
+# expire. Everything else, including FINAL (stats can still be corrected), is
+# refetched after BOXSCORE_LIVE_TTL, revalidated with If-None-Match when the API sent an
+# ETag (a 304 reuses the cached body). Oldest entries are evicted past
+# BOXSCORE_CACHE_SIZE. Callers must treat the returned dict as read-only.
+_boxscore_cache: dict[int, dict] = {}
+BOXSCORE_CACHE_SIZE = 4096
+BOXSCORE_LIVE_TTL = timedelta(seconds=60)
+TERMINAL_GAME_STATES = ("OFF",)
+
 
 def fetch_team_schedule(team_abbr: str, start_date: date | None = None) -> list[dict]:
     """
@@ -21,8 +50,8 @@ def fetch_team_schedule(team_abbr: str, start_date: date | None = None) -> list[
 
     season = f"{year}{year + 1}"
 
-    url = f"https://api-web.nhle.com/v1/club-schedule-season/{team_abbr}/{season}"
-    resp = requests.get(url)
+    url = f"/v1/club-schedule-season/{team_abbr}/{season}"
+    resp = _client.get(url)
     resp.raise_for_status()
     data = resp.json()
 
@@ -39,41 +68,62 @@ def fetch_team_schedule(team_abbr: str, start_date: date | None = None) -> list[
 
 
 def fetch_boxscore(game_id: int) -> dict:
-    """Fetch detailed boxscore for a specific game."""
-    url = f"https://api-web.nhle.com/v1/gamecenter/{game_id}/boxscore"
-    resp = requests.get(url)
+    """Fetch detailed boxscore for a specific game (cached, see _boxscore_cache)."""
+    cached = _boxscore_cache.get(game_id)
+    if cached and (
+        cached["data"].get("gameState") in TERMINAL_GAME_STATES
+        or datetime.now() - cached["fetched_at"] < BOXSCORE_LIVE_TTL
+    ):
+        return cached["data"]
+
+    headers = {"If-None-Match": cached["etag"]} if cached and cached["etag"] else {}
+    url = f"/v1/gamecenter/{game_id}/boxscore"
+    resp = _client.get(url, headers=headers)
+    if resp.status_code == 304:
+        cached["fetched_at"] = datetime.now()
+        return cached["data"]
     resp.raise_for_status()
-    return resp.json()
+    data = resp.json()
+
+    _boxscore_cache.pop(game_id, None)
+    if len(_boxscore_cache) >= BOXSCORE_CACHE_SIZE:
+        _boxscore_cache.pop(next(iter(_boxscore_cache)))
+    _boxscore_cache[game_id] = {
+        "fetched_at": datetime.now(),
+        "etag": resp.headers.get("ETag"),
+        "data": data,
+    }
+    return data
 
 
 def fetch_play_by_play(game_id: int) -> dict:
     """Fetch play-by-play data including goal times and assists."""
-    url = f"https://api-web.nhle.com/v1/gamecenter/{game_id}/play-by-play"
-    resp = requests.get(url)
+    url = f"/v1/gamecenter/{game_id}/play-by-play"
+    resp = _client.get(url)
     resp.raise_for_status()
     return resp.json()
 
 
 def fetch_current_roster(team_abbr: str) -> dict:
     """Fetch current roster for a team."""
-    url = f"https://api-web.nhle.com/v1/roster/{team_abbr}/current"
-    resp = requests.get(url)
+    url = f"/v1/roster/{team_abbr}/current"
+    resp = _client.get(url)
     resp.raise_for_status()
     return resp.json()
 
 
 def fetch_player_stats(player_id: int) -> dict:
     """Fetch player profile and career stats."""
-    url = f"https://api-web.nhle.com/v1/player/{player_id}/landing"
-    resp = requests.get(url)
+    url = f"/v1/player/{player_id}/landing"
+    resp = _client.get(url)
     resp.raise_for_status()
     return resp.json()
 
 
 def fetch_standings() -> dict:
     """Fetch current NHL standings."""
-    url = "https://api-web.nhle.com/v1/standings/now"
-    resp = requests.get(url)
+    url = "/v1/standings/now"
+    resp = _client.get(url)
     resp.raise_for_status()
     return resp.json()
 
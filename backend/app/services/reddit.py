@@ -116,11 +116,28 @@ def _ensure_utc(dt: datetime) -> datetime:
 
 def _pgt_title_matches(title: str, opp_nick_lower: str) -> bool:
     """True if `title` looks like a PGT and contains the opponent's nickname."""
-    if not PGT_TITLE_RE.search(title):
-        return False
+    # Cheap substring test first: most of /new doesn't mention the opponent,
+    # so the regex only runs on the handful of titles that do.
     if opp_nick_lower not in title.lower():
         return False
-    return True
+    return PGT_TITLE_RE.search(title) is not None
+
+
+def _dedupe_by_author_body(candidates: list[dict]) -> list[dict]:
+    """Drop repeat (author, body) pairs, keeping the first occurrence.
+
+    Catches copy-paste reposts and the same comment surfacing under two ids.
+    Only the first 256 chars of the body participate in the key.
+    """
+    seen: set[tuple] = set()
+    unique: list[dict] = []
+    for c in candidates:
+        key = (c.get("author"), c["body"][:256])
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(c)
+    return unique
 
 
 def _select_comments(candidates: list[dict]) -> list[dict]:
@@ -129,6 +146,7 @@ def _select_comments(candidates: list[dict]) -> list[dict]:
     Each candidate must have keys: id, body, score, _reply_count, plus whatever
     other metadata (author, permalink, created_utc) the caller wants preserved.
     """
+    candidates = _dedupe_by_author_body(candidates)
     by_score = sorted(candidates, key=lambda c: c["score"], reverse=True)[:30]
     by_replies = sorted(candidates, key=lambda c: c["_reply_count"], reverse=True)[:10]
 
@@ -198,6 +216,7 @@ def _fetch_comments_via_praw(thread_id: str) -> list[dict]:
     candidates = []
     for c in top_level:
         body = getattr(c, "body", "") or ""
+        # Also drops "[deleted]" / "[removed]" placeholders
         if len(body) < 20:
             continue
         score = getattr(c, "score", 0) or 0
@@ -304,8 +323,7 @@ def _fetch_comments_via_anon(thread_id: str) -> list[dict]:
             continue
         c = child.get("data") or {}
         body = c.get("body") or ""
-        if body in ("[deleted]", "[removed]"):
-            continue
+        # Also drops "[deleted]" / "[removed]" placeholders
         if len(body) < 20:
             continue
         score = c.get("score", 0) or 0
@@ -365,8 +383,8 @@ def fetch_thread_comments(thread_id: str) -> list[dict]:
     """Fetch and prioritize top-level comments from a thread for sentiment analysis.
 
     Q5a selection strategy: top-level only; drop AutoMod and score < 1; drop
-    bodies under 20 chars; take top 30 by score plus top 10 by reply count;
-    de-dupe by id; truncate body to 800 chars.
+    bodies under 20 chars; drop repeated (author, body) pairs; take top 30 by
+    score plus top 10 by reply count; de-dupe by id; truncate body to 800 chars.
 
     Returns a list of dicts: {id, body, score, author, permalink, created_utc}.
     Empty list on any failure (caller decides whether to retry).
@@ -1,21 +1,52 @@
 """Redis caching service with monitoring and proper invalidation."""
 
 import redis
+import redis.asyncio
+import inspect
 import json
 import logging
-from typing import Optional, Any, Dict
+import threading
+from typing import Optional, Any, Dict, Tuple
 from functools import wraps
 from datetime import datetime
+from itertools import count
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+class _AtomicCounter:
+    """
+    Thread-safe counter with lock-free increments.
+
+    next() on an itertools.count is a single C call, so increments from
+    concurrent threads are never lost. Reading consumes one tick from both
+    the increment and read counters, so their difference is the true count;
+    reads take a lock so two concurrent reads can't interleave their ticks.
+    """
+
+    def __init__(self):
+        self._incs = count()
+        self._reads = count()
+        self._read_lock = threading.Lock()
+
+    def increment(self, n: int = 1):
+        for _ in range(n):
+            next(self._incs)
+
+    @property
+    def value(self) -> int:
+        with self._read_lock:
+            return next(self._incs) - next(self._reads)
+
+
+def _new_counters() -> Dict[str, _AtomicCounter]:
+    return {name: _AtomicCounter() for name in ("hits", "misses", "invalidations", "errors")}
+
+
 # Cache metrics for monitoring
 cache_metrics = {
-    "hits": 0,
-    "misses": 0,
-    "invalidations": 0,
-    "errors": 0,
+    **_new_counters(),
     "last_reset": datetime.utcnow().isoformat()
 }
 
@@ -27,6 +58,7 @@ class RedisCache:
         """Initialize Redis connection."""
         self.enabled = settings.REDIS_ENABLED
         self.client = None
+        self.aclient = None
 
         if self.enabled:
             try:
@@ -40,11 +72,23 @@ class RedisCache:
                 )
                 # Test connection
                 self.client.ping()
+                # Async twin for coroutine callers; connects lazily on first use
+                # so it doesn't need its own ping here.
+                self.aclient = redis.asyncio.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    decode_responses=True,
+                    socket_connect_timeout=5,
+                    socket_timeout=5,
+                    max_connections=50
+                )
                 logger.info(f"✓ Redis connected: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
             except Exception as e:
                 logger.error(f"❌ Redis connection failed: {e}")
                 self.enabled = False
                 self.client = None
+                self.aclient = None
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -62,15 +106,15 @@ class RedisCache:
         try:
             value = self.client.get(key)
             if value:
-                cache_metrics["hits"] += 1
+                cache_metrics["hits"].increment()
                 logger.debug(f"Cache HIT: {key}")
                 return json.loads(value)
             else:
-                cache_metrics["misses"] += 1
+                cache_metrics["misses"].increment()
                 logger.debug(f"Cache MISS: {key}")
                 return None
         except Exception as e:
-            cache_metrics["errors"] += 1
+            cache_metrics["errors"].increment()
             logger.error(f"Cache GET error for key '{key}': {e}")
             return None
 
@@ -95,10 +139,38 @@ class RedisCache:
             logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
             return True
         except Exception as e:
-            cache_metrics["errors"] += 1
+            cache_metrics["errors"].increment()
             logger.error(f"Cache SET error for key '{key}': {e}")
             return False
 
+    def warm(self, entries: Dict[str, Tuple[Any, int]]) -> int:
+        """
+        Bulk-populate the cache in a single round trip.
+
+        SETEX commands are pipelined without MULTI/EXEC, so warming N keys
+        costs one network round trip instead of N.
+
+        Args:
+            entries: Mapping of cache key -> (value, ttl_seconds)
+
+        Returns:
+            Number of keys written (0 if disabled or on error)
+        """
+        if not self.enabled or not self.client or not entries:
+            return 0
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, (value, ttl) in entries.items():
+                pipe.setex(key, ttl, json.dumps(value, default=str))
+            pipe.execute()
+            logger.info(f"Cache WARMED: {len(entries)} keys")
+            return len(entries)
+        except Exception as e:
+            cache_metrics["errors"].increment()
+            logger.error(f"Cache WARM error ({len(entries)} keys): {e}")
+            return 0
+
     def invalidate(self, key: str) -> bool:
         """
         Invalidate (delete) a cache key.
@@ -115,11 +187,88 @@ class RedisCache:
         try:
             deleted = self.client.delete(key)
             if deleted:
-                cache_metrics["invalidations"] += 1
+                cache_metrics["invalidations"].increment()
+                logger.info(f"Cache INVALIDATED: {key}")
+            return bool(deleted)
+        except Exception as e:
+            cache_metrics["errors"].increment()
+            logger.error(f"Cache INVALIDATE error for key '{key}': {e}")
+            return False
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """
+        Async version of get() for use from coroutines.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found
+        """
+        if not self.enabled or not self.aclient:
+            return None
+
+        try:
+            value = await self.aclient.get(key)
+            if value:
+                cache_metrics["hits"].increment()
+                logger.debug(f"Cache HIT: {key}")
+                return json.loads(value)
+            else:
+                cache_metrics["misses"].increment()
+                logger.debug(f"Cache MISS: {key}")
+                return None
+        except Exception as e:
+            cache_metrics["errors"].increment()
+            logger.error(f"Cache GET error for key '{key}': {e}")
+            return None
+
+    async def aset(self, key: str, value: Any, ttl: int = 300) -> bool:
+        """
+        Async version of set() for use from coroutines.
+
+        Args:
+            key: Cache key
+            value: Value to cache (will be JSON serialized)
+            ttl: Time to live in seconds (default: 5 minutes)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.enabled or not self.aclient:
+            return False
+
+        try:
+            serialized = json.dumps(value, default=str)
+            await self.aclient.setex(key, ttl, serialized)
+            logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            cache_metrics["errors"].increment()
+            logger.error(f"Cache SET error for key '{key}': {e}")
+            return False
+
+    async def ainvalidate(self, key: str) -> bool:
+        """
+        Async version of invalidate() for use from coroutines.
+
+        Args:
+            key: Cache key to invalidate
+
+        Returns:
+            True if key was deleted, False otherwise
+        """
+        if not self.enabled or not self.aclient:
+            return False
+
+        try:
+            deleted = await self.aclient.delete(key)
+            if deleted:
+                cache_metrics["invalidations"].increment()
                 logger.info(f"Cache INVALIDATED: {key}")
             return bool(deleted)
         except Exception as e:
-            cache_metrics["errors"] += 1
+            cache_metrics["errors"].increment()
             logger.error(f"Cache INVALIDATE error for key '{key}': {e}")
             return False
 
@@ -140,12 +289,12 @@ class RedisCache:
             keys = self.client.keys(pattern)
             if keys:
                 deleted = self.client.delete(*keys)
-                cache_metrics["invalidations"] += deleted
+                cache_metrics["invalidations"].increment(deleted)
                 logger.info(f"Cache INVALIDATED PATTERN: {pattern} ({deleted} keys)")
                 return deleted
             return 0
         except Exception as e:
-            cache_metrics["errors"] += 1
+            cache_metrics["errors"].increment()
             logger.error(f"Cache INVALIDATE PATTERN error for '{pattern}': {e}")
             return 0
 
@@ -156,29 +305,28 @@ class RedisCache:
         Returns:
             Dictionary with hit rate, miss rate, and other metrics
         """
-        total_requests = cache_metrics["hits"] + cache_metrics["misses"]
-        hit_rate = (cache_metrics["hits"] / total_requests * 100) if total_requests > 0 else 0
-        miss_rate = (cache_metrics["misses"] / total_requests * 100) if total_requests > 0 else 0
+        hits = cache_metrics["hits"].value
+        misses = cache_metrics["misses"].value
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+        miss_rate = (misses / total_requests * 100) if total_requests > 0 else 0
 
         return {
             "enabled": self.enabled,
             "connected": bool(self.client),
             "total_requests": total_requests,
-            "hits": cache_metrics["hits"],
-            "misses": cache_metrics["misses"],
+            "hits": hits,
+            "misses": misses,
             "hit_rate_percent": round(hit_rate, 2),
             "miss_rate_percent": round(miss_rate, 2),
-            "invalidations": cache_metrics["invalidations"],
-            "errors": cache_metrics["errors"],
+            "invalidations": cache_metrics["invalidations"].value,
+            "errors": cache_metrics["errors"].value,
             "last_reset": cache_metrics["last_reset"]
         }
 
     def reset_metrics(self):
         """Reset cache metrics."""
-        cache_metrics["hits"] = 0
-        cache_metrics["misses"] = 0
-        cache_metrics["invalidations"] = 0
-        cache_metrics["errors"] = 0
+        cache_metrics.update(_new_counters())
         cache_metrics["last_reset"] = datetime.utcnow().isoformat()
         logger.info("Cache metrics reset")
 
@@ -242,6 +390,33 @@ def cached(key_prefix: str, ttl: int = 300, invalidate_on: Optional[list] = None
             return db.query(Game).limit(limit).all()
     """
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            # Coroutines go through the async client so cache I/O doesn't
+            # block the event loop.
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = cache_key(key_prefix, *args, **kwargs)
+
+                cached_value = await cache.aget(key)
+                if cached_value is not None:
+                    logger.debug(f"Returning cached result for {func.__name__}")
+                    return cached_value
+
+                logger.debug(f"Cache miss - executing {func.__name__}")
+                result = await func(*args, **kwargs)
+
+                await cache.aset(key, result, ttl=ttl)
+
+                return result
+
+            async_wrapper._cache_info = {
+                "key_prefix": key_prefix,
+                "ttl": ttl,
+                "invalidate_on": invalidate_on or []
+            }
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Generate cache key from function args
@@ -1,18 +1,41 @@
 """YouTube API service for fetching game highlight videos."""
 
+import asyncio
 import logging
 import re
+import httpx
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Collection, List, Dict, Optional
 from app.config import settings
+from app.services.redis_cache import cache, cache_key
 
 logger = logging.getLogger(__name__)
 
-# Only import if API key is configured
-if settings.YOUTUBE_API_KEY:
+# Google API keys are "AIza" + 35 URL-safe characters. A malformed key is
+# rejected here instead of failing (and still costing quota) on the first call.
+_API_KEY_RE = re.compile(r"^AIza[0-9A-Za-z_-]{35}$")
+
+_api_key_valid = bool(settings.YOUTUBE_API_KEY) and bool(_API_KEY_RE.match(settings.YOUTUBE_API_KEY))
+if settings.YOUTUBE_API_KEY and not _api_key_valid:
+    logger.error("YOUTUBE_API_KEY is malformed; YouTube integration disabled")
+
+# Only import if a well-formed API key is configured
+if _api_key_valid:
+    import httplib2
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
-    youtube = build('youtube', 'v3', developerKey=settings.YOUTUBE_API_KEY)
+    # Explicit transport so API calls time out after 10s instead of hanging
+    # (build() otherwise creates its own Http with no timeout).
+    _http = httplib2.Http(timeout=10)
+    # static_discovery=True is already the 2.x default; stated explicitly to
+    # pin use of the bundled discovery document. cache_discovery is unused then.
+    youtube = build(
+        'youtube', 'v3',
+        developerKey=settings.YOUTUBE_API_KEY,
+        http=_http,
+        static_discovery=True,
+        cache_discovery=False,
+    )
 else:
     youtube = None
     HttpError = Exception  # fallback for type checking
@@ -33,9 +56,50 @@ NHL_UPLOADS_PLAYLIST = "UUqFMzb-4AUf6WAIbl132QKA"
 SPORTSNET_UPLOADS_PLAYLIST = "UUVhibwHk4WKw4leUt6JfRLg"
 PROFESSOR_HOCKEY_UPLOADS_PLAYLIST = "UUpSAxcOssY_Ul57opYBcWVw"
 
+# Pages of uploads scanned per playlist (50 videos per page)
+UPLOAD_PLAYLIST_PAGES = {
+    NHL_UPLOADS_PLAYLIST: 80,
+    SPORTSNET_UPLOADS_PLAYLIST: 80,
+    PROFESSOR_HOCKEY_UPLOADS_PLAYLIST: 5,
+}
+
+# Playlist warmed by prefetch_channel_uploads() for each video type
+PREFETCH_PLAYLISTS = {
+    "nhl_official": NHL_UPLOADS_PLAYLIST,
+    "professor_hockey": PROFESSOR_HOCKEY_UPLOADS_PLAYLIST,
+}
+
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+
+# Google APIs only gzip a response when Accept-Encoding allows it AND the
+# User-Agent contains "gzip". googleapiclient sends both on its own; the raw
+# httpx calls below need them set explicitly.
+GZIP_HEADERS = {
+    "Accept-Encoding": "gzip",
+    "User-Agent": "nhl-faninsights/1.0 (gzip)",
+}
+
+# Searches only consider uploads from this many hours before the game onward
+PUBLISHED_AFTER_LEAD = 6
+
+# Partial-response field masks: the API returns only the keys we read, which
+# cuts response size several-fold. Keep in sync with the parsing helpers.
+_THUMBNAIL_FIELDS = "thumbnails(high/url,default/url)"
+PLAYLIST_ITEM_FIELDS = (
+    "nextPageToken,"
+    f"items/snippet(resourceId/videoId,title,channelTitle,publishedAt,{_THUMBNAIL_FIELDS})"
+)
+SEARCH_ITEM_FIELDS = (
+    f"items(id/videoId,snippet(title,channelId,channelTitle,publishedAt,{_THUMBNAIL_FIELDS}))"
+)
+
 # In-memory cache for channel upload lists
 _channel_video_cache: Dict[str, dict] = {}
 
+# search.list responses are cached in Redis, keyed by the request params, so
+# repeats across runs and workers skip the 100-unit search cost.
+SEARCH_CACHE_TTL = 86400  # 24 hours
+
 # Team abbreviation to name mapping
 TEAM_NAMES = {
     "SJS": "Sharks", "VGK": "Golden Knights", "LAK": "Kings",
@@ -57,6 +121,11 @@ def _format_date_no_leading_zero(dt: datetime) -> str:
     return f"{dt.strftime('%B')} {dt.day}, {dt.year}"
 
 
+def _format_published_after(game_date: datetime) -> str:
+    """publishedAfter value for a game: RFC 3339, PUBLISHED_AFTER_LEAD hours before puck drop."""
+    return (game_date - timedelta(hours=PUBLISHED_AFTER_LEAD)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
 def _check_quota_error(e: Exception):
     """Raise YouTubeQuotaExceeded if it's a quota error."""
     if isinstance(e, HttpError) and e.resp.status == 403:
@@ -67,6 +136,20 @@ def _check_quota_error(e: Exception):
 # Playlist-based video fetching (1 quota unit per 50 videos)
 # ============================================================================
 
+def _playlist_item_to_video(item: dict) -> dict:
+    """Convert a playlistItems.list() item to the cached upload format."""
+    snippet = item["snippet"]
+    thumbnails = snippet.get("thumbnails", {})
+    thumb_url = (thumbnails.get("high") or thumbnails.get("default", {})).get("url", "")
+    return {
+        "video_id": snippet["resourceId"]["videoId"],
+        "title": snippet["title"],
+        "channel_name": snippet.get("channelTitle", ""),
+        "thumbnail_url": thumb_url,
+        "published_at": snippet["publishedAt"],
+    }
+
+
 def _fetch_channel_uploads(playlist_id: str, max_pages: int = 20) -> List[dict]:
     """
     Fetch recent uploads from a channel's uploads playlist.
@@ -84,7 +167,8 @@ def _fetch_channel_uploads(playlist_id: str, max_pages: int = 20) -> List[dict]:
                 playlistId=playlist_id,
                 part="snippet",
                 maxResults=50,
-                pageToken=page_token
+                pageToken=page_token,
+                fields=PLAYLIST_ITEM_FIELDS,
             )
             response = request.execute()
         except HttpError as e:
@@ -92,17 +176,7 @@ def _fetch_channel_uploads(playlist_id: str, max_pages: int = 20) -> List[dict]:
             logger.error(f"Error fetching playlist {playlist_id}: {e}")
             break
 
-        for item in response.get("items", []):
-            snippet = item["snippet"]
-            thumbnails = snippet.get("thumbnails", {})
-            thumb_url = (thumbnails.get("high") or thumbnails.get("default", {})).get("url", "")
-            videos.append({
-                "video_id": snippet["resourceId"]["videoId"],
-                "title": snippet["title"],
-                "channel_name": snippet.get("channelTitle", ""),
-                "thumbnail_url": thumb_url,
-                "published_at": snippet["publishedAt"],
-            })
+        videos.extend(_playlist_item_to_video(item) for item in response.get("items", []))
 
         page_token = response.get("nextPageToken")
         if not page_token:
@@ -112,13 +186,16 @@ def _fetch_channel_uploads(playlist_id: str, max_pages: int = 20) -> List[dict]:
     return videos
 
 
+def _is_upload_cache_fresh(playlist_id: str, max_age_hours: int) -> bool:
+    """True if the playlist's cached uploads are younger than max_age_hours."""
+    cached = _channel_video_cache.get(playlist_id)
+    return bool(cached) and datetime.now() - cached["fetched_at"] < timedelta(hours=max_age_hours)
+
+
 def _get_cached_uploads(playlist_id: str, max_age_hours: int = 6, max_pages: int = 20) -> List[dict]:
     """Get channel uploads from cache, or fetch and cache them."""
-    cached = _channel_video_cache.get(playlist_id)
-    if cached:
-        age = datetime.now() - cached["fetched_at"]
-        if age < timedelta(hours=max_age_hours):
-            return cached["videos"]
+    if _is_upload_cache_fresh(playlist_id, max_age_hours):
+        return _channel_video_cache[playlist_id]["videos"]
 
     videos = _fetch_channel_uploads(playlist_id, max_pages=max_pages)
     _channel_video_cache[playlist_id] = {
@@ -128,6 +205,105 @@ def _get_cached_uploads(playlist_id: str, max_age_hours: int = 6, max_pages: int
     return videos
 
 
+async def _afetch_channel_uploads(
+    client: httpx.AsyncClient, playlist_id: str, max_pages: int
+) -> List[dict]:
+    """Async twin of _fetch_channel_uploads() against the REST endpoint."""
+    videos = []
+    page_token = None
+
+    for _ in range(max_pages):
+        params = {
+            "playlistId": playlist_id,
+            "part": "snippet",
+            "maxResults": 50,
+            "fields": PLAYLIST_ITEM_FIELDS,
+        }
+        if page_token:
+            params["pageToken"] = page_token
+        resp = await client.get(f"{YOUTUBE_API_URL}/playlistItems", params=params)
+        if resp.status_code == 403:
+            raise YouTubeQuotaExceeded("YouTube API quota exceeded")
+        if resp.is_error:
+            logger.error(f"Error fetching playlist {playlist_id}: HTTP {resp.status_code}")
+            break
+
+        data = resp.json()
+        videos.extend(_playlist_item_to_video(item) for item in data.get("items", []))
+
+        page_token = data.get("nextPageToken")
+        if not page_token:
+            break
+
+    logger.info(f"Fetched {len(videos)} videos from playlist {playlist_id}")
+    return videos
+
+
+def prefetch_channel_uploads(
+    video_types: Collection[str] = ("nhl_official", "professor_hockey"),
+    max_age_hours: int = 6,
+) -> None:
+    """
+    Warm the uploads cache for the primary playlist of each requested video
+    type, fetching the stale ones concurrently.
+
+    The playlists are independent, so batch jobs call this once up front and
+    pay for the slowest playlist rather than the sum of all of them. Pass only
+    the types the pending games still need, so no quota is spent on the
+    others. Sportsnet is a fallback for unmatched NHL highlights and stays
+    lazy in search_game_highlights().
+
+    Raises YouTubeQuotaExceeded if the API quota is exhausted.
+    """
+    if not youtube:
+        return
+
+    stale = [
+        (playlist_id, UPLOAD_PLAYLIST_PAGES[playlist_id])
+        for video_type, playlist_id in PREFETCH_PLAYLISTS.items()
+        if video_type in video_types
+        and not _is_upload_cache_fresh(playlist_id, max_age_hours)
+    ]
+    if not stale:
+        return
+
+    async def fetch_all():
+        # Key goes in a header, not the query string, so it never appears in
+        # logged request URLs
+        headers = {**GZIP_HEADERS, "X-Goog-Api-Key": settings.YOUTUBE_API_KEY}
+        async with httpx.AsyncClient(timeout=10, headers=headers) as client:
+            return await asyncio.gather(
+                *(_afetch_channel_uploads(client, pid, pages) for pid, pages in stale),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(fetch_all())
+    fetched_at = datetime.now()
+    for (playlist_id, _), result in zip(stale, results):
+        if isinstance(result, YouTubeQuotaExceeded):
+            raise result
+        if isinstance(result, Exception):
+            # Left stale; search_game_highlights() retries it lazily
+            logger.error(f"Error prefetching playlist {playlist_id}: {result}")
+            continue
+        _channel_video_cache[playlist_id] = {
+            "fetched_at": fetched_at,
+            "videos": result,
+        }
+
+
+def _cached_search(**params) -> dict:
+    """Run youtube.search().list(**params), reusing a cached response within the TTL."""
+    key = cache_key("youtube:search", **params)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+
+    response = youtube.search().list(**params).execute()
+    cache.set(key, response, ttl=SEARCH_CACHE_TTL)
+    return response
+
+
 def _match_video_to_game(
     videos: List[dict],
     away_team: str,
@@ -198,12 +374,17 @@ def search_game_highlights(
     home_team: str,
     game_date: datetime,
     max_results: int = 5,
-    sharks_game_number: int = None
+    sharks_game_number: int = None,
+    video_types: Collection[str] = ("nhl_official", "professor_hockey"),
 ) -> Dict[str, Optional[str]]:
     """
     Search for game highlight videos using playlist-based matching.
     Falls back to search API only if playlist matching fails.
 
+    video_types limits which of "nhl_official" / "professor_hockey" are looked
+    up; callers that need only one skip the other's lookups (and, for
+    highlights, the 100-unit search fallback). Skipped types come back None.
+
     Raises YouTubeQuotaExceeded if the API quota is exhausted.
     """
     if not youtube:
@@ -219,21 +400,24 @@ def search_game_highlights(
         "other_highlights": []
     }
 
+    want_highlights = "nhl_official" in video_types
+
     # Step 1: Try NHL channel uploads (playlist API - 1 unit per 50 videos, cached)
-    try:
-        nhl_videos = _get_cached_uploads(NHL_UPLOADS_PLAYLIST, max_pages=80)
-        match = _match_video_to_game(nhl_videos, away_team, home_team, game_date)
-        if match:
-            results["nhl_official"] = _build_video_result(match)
-    except YouTubeQuotaExceeded:
-        raise
-    except Exception as e:
-        logger.error(f"Error matching NHL uploads: {e}")
+    if want_highlights:
+        try:
+            nhl_videos = _get_cached_uploads(NHL_UPLOADS_PLAYLIST, max_pages=UPLOAD_PLAYLIST_PAGES[NHL_UPLOADS_PLAYLIST])
+            match = _match_video_to_game(nhl_videos, away_team, home_team, game_date)
+            if match:
+                results["nhl_official"] = _build_video_result(match)
+        except YouTubeQuotaExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error matching NHL uploads: {e}")
 
     # Step 2: If no NHL match, try Sportsnet uploads
-    if not results["nhl_official"]:
+    if want_highlights and not results["nhl_official"]:
         try:
-            sn_videos = _get_cached_uploads(SPORTSNET_UPLOADS_PLAYLIST, max_pages=80)
+            sn_videos = _get_cached_uploads(SPORTSNET_UPLOADS_PLAYLIST, max_pages=UPLOAD_PLAYLIST_PAGES[SPORTSNET_UPLOADS_PLAYLIST])
             match = _match_video_to_game(sn_videos, away_team, home_team, game_date)
             if match:
                 results["nhl_official"] = _build_video_result(match)
@@ -243,22 +427,23 @@ def search_game_highlights(
             logger.error(f"Error matching Sportsnet uploads: {e}")
 
     # Step 3: Try Professor Hockey uploads
-    try:
-        prof_videos = _get_cached_uploads(PROFESSOR_HOCKEY_UPLOADS_PLAYLIST, max_pages=5)
-        match = _match_video_to_game(
-            prof_videos, away_team, home_team, game_date,
-            match_type="professor_hockey",
-            sharks_game_number=sharks_game_number,
-        )
-        if match:
-            results["professor_hockey"] = _build_video_result(match)
-    except YouTubeQuotaExceeded:
-        raise
-    except Exception as e:
-        logger.error(f"Error matching Professor Hockey uploads: {e}")
+    if "professor_hockey" in video_types:
+        try:
+            prof_videos = _get_cached_uploads(PROFESSOR_HOCKEY_UPLOADS_PLAYLIST, max_pages=UPLOAD_PLAYLIST_PAGES[PROFESSOR_HOCKEY_UPLOADS_PLAYLIST])
+            match = _match_video_to_game(
+                prof_videos, away_team, home_team, game_date,
+                match_type="professor_hockey",
+                sharks_game_number=sharks_game_number,
+            )
+            if match:
+                results["professor_hockey"] = _build_video_result(match)
+        except YouTubeQuotaExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error matching Professor Hockey uploads: {e}")
 
     # Step 4: Fallback to search API if playlist matching found nothing
-    if not results["nhl_official"]:
+    if want_highlights and not results["nhl_official"]:
         try:
             results["nhl_official"] = _search_fallback_highlights(
                 away_team, home_team, game_date
@@ -276,50 +461,35 @@ def _search_fallback_highlights(
     home_team: str,
     game_date: datetime,
 ) -> Optional[dict]:
-    """Fallback: use search API for games not matched by playlist. Costs 100 units."""
+    """
+    Fallback: use search API for games not matched by playlist. Costs 100 units.
+
+    Scoped to the NHL channel only; Sportsnet is covered by its uploads
+    playlist in step 2, so a second 100-unit search for it isn't spent here.
+    """
     away_name = TEAM_NAMES.get(away_team, away_team)
     home_name = TEAM_NAMES.get(home_team, home_team)
     date_str = _format_date_no_leading_zero(game_date)
-    published_after = game_date - timedelta(hours=6)
 
     try:
-        response = youtube.search().list(
+        response = _cached_search(
             q=f"{away_name} vs {home_name} NHL Highlights {date_str}",
             channelId=NHL_CHANNEL_ID,
             type="video",
             part="id,snippet",
+            fields=SEARCH_ITEM_FIELDS,
             maxResults=3,
             order="relevance",
-            publishedAfter=published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
-        ).execute()
-
-        for item in response.get("items", []):
-            title = item["snippet"]["title"].lower()
-            if "highlights" in title:
-                return _extract_video_data(item)
+            publishedAfter=_format_published_after(game_date),
+        )
     except HttpError as e:
         _check_quota_error(e)
-        logger.error(f"Search fallback NHL error: {e}")
-
-    # Try Sportsnet as second fallback
-    try:
-        response = youtube.search().list(
-            q=f"NHL Highlights {away_name} vs {home_name} {date_str}",
-            channelId=SPORTSNET_CHANNEL_ID,
-            type="video",
-            part="id,snippet",
-            maxResults=3,
-            order="relevance",
-            publishedAfter=published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
-        ).execute()
+        logger.error(f"Search fallback error: {e}")
+        return None
 
-        for item in response.get("items", []):
-            title = item["snippet"]["title"].lower()
-            if "highlights" in title:
-                return _extract_video_data(item)
-    except HttpError as e:
-        _check_quota_error(e)
-        logger.error(f"Search fallback Sportsnet error: {e}")
+    for item in response.get("items", []):
+        if "highlights" in item["snippet"]["title"].lower():
+            return _extract_video_data(item)
 
     return None
 
@@ -346,7 +516,8 @@ def get_video_details(video_id: str) -> Optional[Dict]:
     try:
         response = youtube.videos().list(
             part="snippet,contentDetails",
-            id=video_id
+            id=video_id,
+            fields="items/snippet(title,channelTitle,channelId,publishedAt,description,thumbnails/high/url)",
         ).execute()
 
         if not response.get("items"):
@@ -383,14 +554,15 @@ def search_individual_goal_clips(
     query = f"{scorer_name} goal {team} {_format_date_no_leading_zero(game_date)}"
 
     try:
-        response = youtube.search().list(
+        response = _cached_search(
             q=query,
             type="video",
             part="id",
+            fields="items(id/videoId)",
             maxResults=max_results,
             order="relevance",
-            publishedAfter=(game_date - timedelta(hours=6)).strftime('%Y-%m-%dT%H:%M:%SZ')
-        ).execute()
+            publishedAfter=_format_published_after(game_date),
+        )
 
         return [item["id"]["videoId"] for item in response.get("items", [])]
     except HttpError as e:
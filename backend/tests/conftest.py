@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session; app lifespan runs once."""
+    with TestClient(app) as c:
+        yield c
@@ -0,0 +1,125 @@
+"""Unit tests for the fetch_boxscore in-process cache and ETag revalidation.
+
+The shared NHL httpx client is swapped for one backed by httpx.MockTransport,
+so these run offline and can assert exactly which requests were sent.
+"""
+from datetime import datetime
+
+import httpx
+import pytest
+
+from app.services import nhl
+
+GAME_ID = 2024020001
+
+
+@pytest.fixture
+def nhl_api(monkeypatch):
+    """Fresh boxscore cache plus a mock NHL API serving queued responses.
+
+    Returns (queue, sent): append httpx.Response objects to `queue` in the
+    order they should be served; `sent` collects the requests made.
+    """
+    queue, sent = [], []
+
+    def handler(request):
+        sent.append(request)
+        return queue.pop(0)
+
+    monkeypatch.setattr(nhl, "_boxscore_cache", {})
+    monkeypatch.setattr(nhl, "_client", httpx.Client(
+        base_url=nhl.NHL_API_BASE_URL, transport=httpx.MockTransport(handler),
+    ))
+    return queue, sent
+
+
+def _boxscore(state, score=1, etag=None):
+    headers = {"ETag": etag} if etag else {}
+    return httpx.Response(200, json={"gameState": state, "awayTeam": {"score": score}}, headers=headers)
+
+
+def _expire(game_id=GAME_ID):
+    """Age a cache entry past the live TTL."""
+    nhl._boxscore_cache[game_id]["fetched_at"] = datetime.now() - 2 * nhl.BOXSCORE_LIVE_TTL
+
+
+@pytest.mark.unit
+def test_first_fetch_stores_etag(nhl_api):
+    queue, sent = nhl_api
+    queue.append(_boxscore("LIVE", etag='"v1"'))
+
+    data = nhl.fetch_boxscore(GAME_ID)
+
+    assert data["gameState"] == "LIVE"
+    assert "If-None-Match" not in sent[0].headers
+    entry = nhl._boxscore_cache[GAME_ID]
+    assert entry["etag"] == '"v1"'
+    assert entry["data"] is data
+
+
+@pytest.mark.unit
+def test_fresh_entry_served_without_request(nhl_api):
+    queue, sent = nhl_api
+    queue.append(_boxscore("LIVE", etag='"v1"'))
+
+    first = nhl.fetch_boxscore(GAME_ID)
+    assert nhl.fetch_boxscore(GAME_ID) is first
+    assert len(sent) == 1
+
+
+@pytest.mark.unit
+def test_304_returns_cached_body(nhl_api):
+    queue, sent = nhl_api
+    queue.append(_boxscore("LIVE", etag='"v1"'))
+    cached = nhl.fetch_boxscore(GAME_ID)
+    _expire()
+    stale_at = nhl._boxscore_cache[GAME_ID]["fetched_at"]
+
+    queue.append(httpx.Response(304))
+    data = nhl.fetch_boxscore(GAME_ID)
+
+    assert data is cached
+    assert sent[1].headers["If-None-Match"] == '"v1"'
+    assert nhl._boxscore_cache[GAME_ID]["fetched_at"] > stale_at
+
+
+@pytest.mark.unit
+def test_200_on_revalidation_replaces_entry(nhl_api):
+    queue, sent = nhl_api
+    queue.append(_boxscore("LIVE", score=1, etag='"v1"'))
+    nhl.fetch_boxscore(GAME_ID)
+    _expire()
+
+    queue.append(_boxscore("LIVE", score=2, etag='"v2"'))
+    data = nhl.fetch_boxscore(GAME_ID)
+
+    assert sent[1].headers["If-None-Match"] == '"v1"'
+    assert data["awayTeam"]["score"] == 2
+    entry = nhl._boxscore_cache[GAME_ID]
+    assert entry["etag"] == '"v2"'
+    assert entry["data"] is data
+
+
+@pytest.mark.unit
+def test_terminal_state_never_refetched(nhl_api):
+    queue, sent = nhl_api
+    queue.append(_boxscore("OFF", etag='"v1"'))
+    cached = nhl.fetch_boxscore(GAME_ID)
+    _expire()
+
+    assert nhl.fetch_boxscore(GAME_ID) is cached
+    assert len(sent) == 1
+
+
+@pytest.mark.unit
+def test_final_state_is_revalidated(nhl_api):
+    """FINAL can still receive stat corrections, so it isn't terminal."""
+    queue, sent = nhl_api
+    queue.append(_boxscore("FINAL", etag='"v1"'))
+    nhl.fetch_boxscore(GAME_ID)
+    _expire()
+
+    queue.append(httpx.Response(304))
+    nhl.fetch_boxscore(GAME_ID)
+
+    assert len(sent) == 2
@@ -0,0 +1,23 @@
+"""Unit tests for Reddit comment pre-selection helpers in app.services.reddit."""
+import pytest
+
+from app.services.reddit import _dedupe_by_author_body
+
+
+def _comment(cid, author, body):
+    return {"id": cid, "author": author, "body": body, "score": 1, "_reply_count": 0}
+
+
+@pytest.mark.unit
+def test_dedupe_collapses_repeat_author_body_and_keeps_order():
+    comments = [
+        _comment("a", "alice", "Celebrini is the real deal this year"),
+        _comment("b", "bob", "Goaltending cost us this game again"),
+        _comment("c", "alice", "Celebrini is the real deal this year"),  # repost
+        _comment("d", "carol", "Celebrini is the real deal this year"),  # same body, other author
+        _comment("e", "bob", "Goaltending cost us this game again"),      # repost
+    ]
+
+    result = _dedupe_by_author_body(comments)
+
+    assert [c["id"] for c in result] == ["a", "b", "d"]
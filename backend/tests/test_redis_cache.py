@@ -0,0 +1,176 @@
+"""Unit tests for app.services.redis_cache: metric counters and the bulk/async helpers.
+
+Redis itself is faked, so these run without a server.
+"""
+import json
+import threading
+
+import pytest
+
+from app.services import redis_cache
+from app.services.redis_cache import RedisCache, _AtomicCounter
+
+
+# --- fakes for the redis clients --------------------------------------------
+
+class _FakePipeline:
+    def __init__(self, store, fail=False):
+        self._store = store
+        self._fail = fail
+        self._queued = []
+
+    def setex(self, key, ttl, value):
+        self._queued.append((key, ttl, value))
+
+    def execute(self):
+        if self._fail:
+            raise ConnectionError("redis down")
+        for key, ttl, value in self._queued:
+            self._store[key] = (value, ttl)
+
+
+class _FakeRedis:
+    def __init__(self, fail=False):
+        self.store = {}
+        self.fail = fail
+        self.pipelines = []
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        pipe = _FakePipeline(self.store, fail=self.fail)
+        self.pipelines.append(pipe)
+        return pipe
+
+
+class _FakeAsyncRedis:
+    def __init__(self, fail=False):
+        self.store = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        entry = self.store.get(key)
+        return entry[0] if entry else None
+
+    async def setex(self, key, ttl, value):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.store[key] = (value, ttl)
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Fresh metric counters for the test."""
+    monkeypatch.setattr(redis_cache, "cache_metrics", redis_cache._new_counters())
+    return redis_cache.cache_metrics
+
+
+def _cache(client=None, aclient=None):
+    c = RedisCache.__new__(RedisCache)
+    c.enabled = True
+    c.client = client
+    c.aclient = aclient
+    return c
+
+
+# --- _AtomicCounter ---------------------------------------------------------
+
+@pytest.mark.unit
+def test_counter_counts_and_reads_are_stable():
+    counter = _AtomicCounter()
+    assert counter.value == 0
+    counter.increment()
+    counter.increment(4)
+    assert counter.value == 5
+    assert counter.value == 5  # reading doesn't change the count
+
+
+@pytest.mark.unit
+def test_counter_concurrent_increments_and_reads():
+    counter = _AtomicCounter()
+    threads_n, per_thread = 8, 1000
+    reads = []
+
+    def work():
+        for _ in range(per_thread):
+            counter.increment()
+            reads.append(counter.value)
+
+    threads = [threading.Thread(target=work) for _ in range(threads_n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert counter.value == threads_n * per_thread
+    assert all(0 < r <= threads_n * per_thread for r in reads)
+
+
+# --- warm() -----------------------------------------------------------------
+
+@pytest.mark.unit
+def test_warm_pipelines_all_entries(metrics):
+    client = _FakeRedis()
+    cache = _cache(client=client)
+
+    warmed = cache.warm({"game:1": ({"id": 1}, 300), "game:2": ({"id": 2}, 60)})
+
+    assert warmed == 2
+    assert len(client.pipelines) == 1
+    assert client.store["game:1"] == (json.dumps({"id": 1}), 300)
+    assert client.store["game:2"] == (json.dumps({"id": 2}), 60)
+
+
+@pytest.mark.unit
+def test_warm_noop_when_disabled_or_empty(metrics):
+    client = _FakeRedis()
+    cache = _cache(client=client)
+    assert cache.warm({}) == 0
+
+    cache.enabled = False
+    assert cache.warm({"game:1": ({"id": 1}, 300)}) == 0
+    assert client.store == {}
+
+
+@pytest.mark.unit
+def test_warm_error_counts_and_returns_zero(metrics):
+    cache = _cache(client=_FakeRedis(fail=True))
+    assert cache.warm({"game:1": ({"id": 1}, 300)}) == 0
+    assert metrics["errors"].value == 1
+
+
+# --- aget() / aset() --------------------------------------------------------
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_aset_then_aget_roundtrip(metrics):
+    cache = _cache(aclient=_FakeAsyncRedis())
+
+    assert await cache.aset("game:1", {"id": 1}, ttl=120) is True
+    assert cache.aclient.store["game:1"][1] == 120
+    assert await cache.aget("game:1") == {"id": 1}
+    assert await cache.aget("game:2") is None
+    assert metrics["hits"].value == 1
+    assert metrics["misses"].value == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_helpers_swallow_errors(metrics):
+    cache = _cache(aclient=_FakeAsyncRedis(fail=True))
+
+    assert await cache.aset("game:1", {"id": 1}) is False
+    assert await cache.aget("game:1") is None
+    assert metrics["errors"].value == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_helpers_noop_when_disabled(metrics):
+    cache = _cache(aclient=_FakeAsyncRedis())
+    cache.enabled = False
+
+    assert await cache.aset("game:1", {"id": 1}) is False
+    assert await cache.aget("game:1") is None
+    assert cache.aclient.store == {}
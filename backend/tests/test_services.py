@@ -1,7 +1,10 @@
 """
 Test NHL API services.
 """
+import os
+
 import pytest
+import requests
 from datetime import date
 from app.services.nhl import (
     fetch_team_schedule,
@@ -9,8 +12,36 @@ from app.services.nhl import (
 )
 
 
+@pytest.fixture(scope="module")
+def vcr_config():
+    """Replay NHL API responses from tests/cassettes/; record only when missing.
+
+    Re-record with: pytest --record-mode=rewrite tests/test_services.py
+    """
+    return {"record_mode": "once"}
+
+
+@pytest.fixture(scope="session")
+def nhl_api_up():
+    """One short HEAD per session instead of full GETs timing out per test."""
+    try:
+        requests.head("https://api-web.nhle.com/v1/", timeout=2)
+        return True
+    except requests.RequestException:
+        return False
+
+
+@pytest.fixture
+def require_nhl_api(request, vcr_cassette_dir, default_cassette_name):
+    """Skip when there is no cassette to replay and the NHL API is down."""
+    cassette = os.path.join(vcr_cassette_dir, f"{default_cassette_name}.yaml")
+    if not os.path.exists(cassette) and not request.getfixturevalue("nhl_api_up"):
+        pytest.skip("NHL API unreachable and no recorded cassette")
+
+
 @pytest.mark.integration
-def test_fetch_team_schedule():
+@pytest.mark.vcr
+def test_fetch_team_schedule(require_nhl_api):
     """Test fetching Sharks schedule from NHL API."""
     games = fetch_team_schedule('SJS', start_date=date(2024, 10, 1))
     assert isinstance(games, list)
@@ -18,7 +49,8 @@ def test_fetch_team_schedule():
 
 
 @pytest.mark.integration
-def test_fetch_boxscore():
+@pytest.mark.vcr
+def test_fetch_boxscore(require_nhl_api):
     """Test fetching boxscore data."""
     # Use a known game ID from the 2024 season
     try:
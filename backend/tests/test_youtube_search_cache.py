@@ -0,0 +1,72 @@
+"""Unit tests for the Redis-backed YouTube search.list cache."""
+import pytest
+
+from app.services import youtube
+
+class _FakeCache:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=300):
+        self.store[key] = value
+        self.ttls[key] = ttl
+        return True
+
+class _FakeRequest:
+    def __init__(self, params):
+        self._params = params
+
+    def execute(self):
+        return {"items": [], "q": self._params["q"]}
+
+class _FakeSearch:
+    def __init__(self, calls):
+        self._calls = calls
+
+    def list(self, **params):
+        self._calls.append(params)
+        return _FakeRequest(params)
+
+class _FakeYouTube:
+    def __init__(self):
+        self.calls = []
+
+    def search(self):
+        return _FakeSearch(self.calls)
+
+@pytest.fixture
+def fake_youtube(monkeypatch):
+    client = _FakeYouTube()
+    monkeypatch.setattr(youtube, "youtube", client)
+    return client
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    fake = _FakeCache()
+    monkeypatch.setattr(youtube, "cache", fake)
+    return fake
+
+@pytest.mark.unit
+def test_repeat_search_is_served_from_cache(fake_youtube, fake_cache):
+    youtube._cached_search(q="sharks", maxResults=10)
+    youtube._cached_search(maxResults=10, q="sharks")
+    assert len(fake_youtube.calls) == 1
+    assert list(fake_cache.ttls.values()) == [youtube.SEARCH_CACHE_TTL]
+
+@pytest.mark.unit
+def test_distinct_params_are_cached_separately(fake_youtube, fake_cache):
+    youtube._cached_search(q="sharks")
+    youtube._cached_search(q="kings")
+    assert len(fake_youtube.calls) == 2
+    assert len(fake_cache.store) == 2
+
+@pytest.mark.unit
+def test_search_runs_every_time_when_cache_disabled(fake_youtube, monkeypatch):
+    monkeypatch.setattr(youtube.cache, "enabled", False)
+    youtube._cached_search(q="sharks")
+    youtube._cached_search(q="sharks")
+    assert len(fake_youtube.calls) == 2